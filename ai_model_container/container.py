@@ -48,6 +48,7 @@ CONTAINER CARDINALITY (CRITICAL):
 """
 
 import json
+import logging
 import signal
 import sys
 import threading
@@ -62,6 +63,24 @@ from .model_config import ModelConfig
 from .model_discovery import ModelDiscovery
 
 
+def _ensure_log_output() -> None:
+    """
+    Send this package's log records (model.yaml validation, discovery)
+    to stdout, next to the container's own output.
+
+    No-op if the application has already configured logging (a handler
+    on the root or package logger); that configuration then applies.
+    """
+    package_logger = logging.getLogger(__package__ or __name__)
+    if package_logger.handlers or logging.getLogger().handlers:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+
 class ModelContainer:
     """
     AI Model Container - long-lived inference runtime.
@@ -135,6 +154,9 @@ class ModelContainer:
         self.model_id = model_id
         self._running = False
 
+        # Discovery and model.yaml validation log via the logging module
+        _ensure_log_output()
+
         # Phase 7: Observability metrics (best-effort, non-blocking)
         # CRITICAL: Metrics MUST NOT affect inference or container lifecycle
         self._start_time = time.time()
@@ -147,7 +169,7 @@ class ModelContainer:
             # Attempt discovery
             print(f"Attempting model discovery for: {model_id}")
             discovery = ModelDiscovery(models_dir=models_dir)
-            available_models = discovery.discover_models()
+            available_models = discovery.discover_models(model_id)
 
             if discovery.is_available(model_id):
                 model_cfg = discovery.get_model(model_id)
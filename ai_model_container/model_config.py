@@ -24,17 +24,41 @@ WHAT THIS IS NOT:
 - Model version management
 """
 
+import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 try:
     import yaml
 except ImportError:
     yaml = None  # Will fail gracefully if not available
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# slots=True requires Python 3.10+; the base image still ships 3.9
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SEP = os.sep
+
+# Interning pool for small immutable sequences (supported_tasks,
+# expected_resolution). Most models declare identical values, so configs
+# share one tuple instead of each holding its own list.
+_TUPLE_POOL: Dict[tuple, tuple] = {}
+
+
+def _intern_tuple(values: Any) -> tuple:
+    key = tuple(values)
+    try:
+        return _TUPLE_POOL.setdefault(key, key)
+    except TypeError:
+        # Unhashable elements: keep the tuple, skip interning
+        return key
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ModelConfig:
     """
     Parsed and validated model configuration from model.yaml.
@@ -44,7 +68,9 @@ class ModelConfig:
     - Requirements (GPU, input format, resolution)
     - Capabilities (supported tasks, output schema)
 
-    IMMUTABLE after parsing.
+    IMMUTABLE after parsing (frozen dataclass; assignment raises
+    FrozenInstanceError). Slotted on Python 3.10+ so instances carry
+    no per-instance __dict__.
     """
 
     # Identity
@@ -53,11 +79,11 @@ class ModelConfig:
     model_version: str
 
     # Capabilities
-    supported_tasks: List[str]  # e.g., ["object_detection", "tracking"]
+    supported_tasks: Tuple[str, ...]  # e.g., ("object_detection", "tracking")
 
     # Input requirements
     input_format: str  # e.g., "NV12", "RGB24"
-    expected_resolution: List[int]  # [width, height], e.g., [640, 640]
+    expected_resolution: Tuple[int, int]  # (width, height), e.g., (640, 640)
 
     # Resource requirements
     gpu_required: bool  # If True, MUST have GPU (no CPU fallback)
@@ -73,19 +99,58 @@ class ModelConfig:
     # Output schema
     output_schema: Dict[str, Any]  # Describes detection output format
 
-    # Optional metadata
+    # Optional metadata (informational only; not used by the runtime).
+    # Parsed by default; RUTH_AI_PARSE_MODEL_METADATA=0 opts out and
+    # leaves the fields as None.
+    PARSE_METADATA: ClassVar[bool] = (
+        os.environ.get("RUTH_AI_PARSE_MODEL_METADATA", "1") != "0"
+    )
+
     description: Optional[str] = None
     author: Optional[str] = None
     license: Optional[str] = None
 
+    # Derived runtime config, built once in __post_init__
+    _runtime_config: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Determine device based on GPU requirements
+        if self.gpu_required:
+            device = "cuda"  # Will fail if GPU unavailable
+        elif self.cpu_fallback_allowed:
+            device = "cuda"  # Will fallback to CPU if unavailable
+        else:
+            device = "cpu"  # Explicit CPU only
+
+        # Frozen dataclass: bypass __setattr__ for the derived field
+        object.__setattr__(self, "_runtime_config", {
+            "model_type": self.model_type,
+            "model_path": self.model_path,
+            "device": device,
+            "input_size": self.expected_resolution,
+            "confidence_threshold": self.confidence_threshold,
+            "nms_iou_threshold": self.nms_iou_threshold,
+        })
+
     @classmethod
-    def from_yaml_file(cls, yaml_path: str, model_dir: str) -> Optional['ModelConfig']:
+    def from_yaml_file(
+        cls,
+        yaml_path: str,
+        model_dir: str,
+        dir_fd: Optional[int] = None
+    ) -> Optional['ModelConfig']:
         """
         Parse and validate model.yaml file.
 
         Args:
             yaml_path: Path to model.yaml
             model_dir: Directory containing the model
+            dir_fd: Optional open file descriptor of the directory that
+                    contains model_dir (the models directory). When given,
+                    relative weights are stat'd relative to it instead of
+                    re-resolving the full path.
 
         Returns:
             ModelConfig if valid, None if invalid
@@ -98,7 +163,7 @@ class ModelConfig:
         - No exceptions raised (fail silently)
         """
         if yaml is None:
-            print(f"ERROR: PyYAML not available. Install with: pip install pyyaml")
+            logger.error("PyYAML not available. Install with: pip install pyyaml")
             return None
 
         try:
@@ -107,44 +172,42 @@ class ModelConfig:
                 data = yaml.safe_load(f)
 
             if not isinstance(data, dict):
-                print(f"ERROR: model.yaml is not a valid YAML dict: {yaml_path}")
-                return None
-
-            # Extract required fields
-            model_id = data.get('model_id')
-            if not model_id or not isinstance(model_id, str):
-                print(f"ERROR: model_id missing or invalid in {yaml_path}")
+                logger.error("model.yaml is not a valid YAML dict: %s", yaml_path)
                 return None
 
-            model_name = data.get('model_name')
-            if not model_name or not isinstance(model_name, str):
-                print(f"ERROR: model_name missing or invalid in {yaml_path}")
-                return None
+            # Extract required identity fields (most common failure: typos)
+            for field_name in ('model_id', 'model_name', 'model_version'):
+                value = data.get(field_name)
+                if not value or not isinstance(value, str):
+                    logger.error("%s missing or invalid in %s", field_name, yaml_path)
+                    return None
 
-            model_version = data.get('model_version')
-            if not model_version or not isinstance(model_version, str):
-                print(f"ERROR: model_version missing or invalid in {yaml_path}")
-                return None
+            model_id = data['model_id']
+            model_name = data['model_name']
+            model_version = data['model_version']
 
             supported_tasks = data.get('supported_tasks', [])
             if not isinstance(supported_tasks, list):
-                print(f"ERROR: supported_tasks must be a list in {yaml_path}")
+                logger.error("supported_tasks must be a list in %s", yaml_path)
                 return None
 
             input_format = data.get('input_format', 'NV12')
             if not isinstance(input_format, str):
-                print(f"ERROR: input_format must be a string in {yaml_path}")
+                logger.error("input_format must be a string in %s", yaml_path)
                 return None
 
             expected_resolution = data.get('expected_resolution', [640, 640])
             if not isinstance(expected_resolution, list) or len(expected_resolution) != 2:
-                print(f"ERROR: expected_resolution must be [width, height] in {yaml_path}")
+                logger.error("expected_resolution must be [width, height] in %s", yaml_path)
                 return None
 
+            supported_tasks = _intern_tuple(supported_tasks)
+            expected_resolution = _intern_tuple(expected_resolution)
+
             # Extract resource requirements
             resource_reqs = data.get('resource_requirements', {})
             if not isinstance(resource_reqs, dict):
-                print(f"ERROR: resource_requirements must be a dict in {yaml_path}")
+                logger.error("resource_requirements must be a dict in %s", yaml_path)
                 return None
 
             gpu_required = resource_reqs.get('gpu_required', False)
@@ -153,52 +216,74 @@ class ModelConfig:
 
             # Validate GPU requirements logic
             if gpu_required and cpu_fallback_allowed:
-                print(f"ERROR: gpu_required=true and cpu_fallback_allowed=true is contradictory in {yaml_path}")
+                logger.error(
+                    "gpu_required=true and cpu_fallback_allowed=true is contradictory in %s",
+                    yaml_path,
+                )
                 return None
 
             # Extract runtime configuration
             model_type = data.get('model_type')
             if not model_type or model_type not in ['pytorch', 'onnx']:
-                print(f"ERROR: model_type must be 'pytorch' or 'onnx' in {yaml_path}")
+                logger.error("model_type must be 'pytorch' or 'onnx' in %s", yaml_path)
                 return None
 
             # Model path can be relative to model_dir or absolute
             model_weights = data.get('model_weights')
             if not model_weights or not isinstance(model_weights, str):
-                print(f"ERROR: model_weights missing or invalid in {yaml_path}")
+                logger.error("model_weights missing or invalid in %s", yaml_path)
                 return None
 
-            # Resolve model path
-            if os.path.isabs(model_weights):
+            # Resolve model path (POSIX-only container: a leading separator
+            # means absolute, otherwise join onto model_dir; an empty
+            # model_dir keeps the path relative, as os.path.join does)
+            if model_weights[:1] == _SEP:
                 model_path = model_weights
+            elif not model_dir or model_dir[-1:] == _SEP:
+                model_path = model_dir + model_weights
             else:
-                model_path = os.path.join(model_dir, model_weights)
-
-            # Check if model file exists
-            if not os.path.exists(model_path):
-                print(f"ERROR: Model weights not found: {model_path}")
-                return None
+                model_path = f"{model_dir}{_SEP}{model_weights}"
 
             confidence_threshold = data.get('confidence_threshold', 0.5)
             if not isinstance(confidence_threshold, (int, float)) or not (0.0 <= confidence_threshold <= 1.0):
-                print(f"ERROR: confidence_threshold must be between 0.0 and 1.0 in {yaml_path}")
+                logger.error("confidence_threshold must be between 0.0 and 1.0 in %s", yaml_path)
                 return None
 
             nms_iou_threshold = data.get('nms_iou_threshold')
             if nms_iou_threshold is not None:
                 if not isinstance(nms_iou_threshold, (int, float)) or not (0.0 <= nms_iou_threshold <= 1.0):
-                    print(f"ERROR: nms_iou_threshold must be between 0.0 and 1.0 in {yaml_path}")
+                    logger.error("nms_iou_threshold must be between 0.0 and 1.0 in %s", yaml_path)
                     return None
 
             output_schema = data.get('output_schema', {})
             if not isinstance(output_schema, dict):
-                print(f"ERROR: output_schema must be a dict in {yaml_path}")
+                logger.error("output_schema must be a dict in %s", yaml_path)
                 return None
 
             # Optional metadata
-            description = data.get('description')
-            author = data.get('author')
-            license_info = data.get('license')
+            if cls.PARSE_METADATA:
+                description = data.get('description')
+                author = data.get('author')
+                license_info = data.get('license')
+            else:
+                description = author = license_info = None
+
+            # Check if model file exists (filesystem I/O last, after all
+            # cheap schema checks have passed)
+            model_dir_name = os.path.basename(model_dir) if dir_fd is not None else ""
+            if model_dir_name and model_weights[:1] != _SEP:
+                weights_rel = f"{model_dir_name}{_SEP}{model_weights}"
+                try:
+                    os.stat(weights_rel, dir_fd=dir_fd)
+                    weights_found = True
+                except OSError:
+                    weights_found = False
+            else:
+                weights_found = os.path.exists(model_path)
+
+            if not weights_found:
+                logger.error("Model weights not found: %s", model_path)
+                return None
 
             # Create ModelConfig
             return cls(
@@ -222,38 +307,88 @@ class ModelConfig:
             )
 
         except FileNotFoundError:
-            print(f"ERROR: model.yaml not found: {yaml_path}")
+            logger.error("model.yaml not found: %s", yaml_path)
             return None
         except yaml.YAMLError as e:
-            print(f"ERROR: Invalid YAML in {yaml_path}: {e}")
+            logger.error("Invalid YAML in %s: %s", yaml_path, e)
             return None
         except Exception as e:
-            print(f"ERROR: Failed to parse model.yaml at {yaml_path}: {e}")
+            logger.error("Failed to parse model.yaml at %s: %s", yaml_path, e)
+            return None
+
+    @classmethod
+    def peek_header(
+        cls, yaml_path: str, max_bytes: int = 1024
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Read only (model_id, model_version) from model.yaml.
+
+        Parses the first max_bytes of the file (cut at the last complete
+        line) instead of the whole document. Identity fields sit at the
+        top of model.yaml by convention, so this usually avoids parsing
+        supported_tasks / output_schema. Falls back to a full parse if
+        the header does not contain both fields.
+
+        NOTE: This does NOT validate the model. Use from_yaml_file()
+        before loading or serving it.
+
+        Args:
+            yaml_path: Path to model.yaml
+            max_bytes: Maximum number of bytes to read for the fast path
+
+        Returns:
+            (model_id, model_version) if found, None otherwise
+        """
+        if yaml is None:
             return None
 
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        try:
+            with open(yaml_path, 'rb') as f:
+                head = f.read(max_bytes)
+                truncated = len(head) == max_bytes and f.read(1) != b''
+
+            if truncated:
+                # Only feed complete lines to the parser
+                head = head[:head.rfind(b'\n') + 1]
+
+            try:
+                data = yaml.load(head, Loader=loader)
+            except yaml.YAMLError:
+                data = None
+
+            if truncated and not cls._has_header(data):
+                with open(yaml_path, 'rb') as f:
+                    data = yaml.load(f, Loader=loader)
+
+            if not cls._has_header(data):
+                return None
+
+            return data['model_id'], data['model_version']
+
+        except Exception:
+            return None
+
+    @staticmethod
+    def _has_header(data: Any) -> bool:
+        return (
+            isinstance(data, dict)
+            and isinstance(data.get('model_id'), str)
+            and isinstance(data.get('model_version'), str)
+        )
+
     def to_runtime_config(self) -> Dict[str, Any]:
         """
         Convert to runtime configuration dict for InferenceHandler.
 
         Returns:
             Dict compatible with Phase 4.2.1/4.2.2 InferenceHandler
-        """
-        # Determine device based on GPU requirements
-        if self.gpu_required:
-            device = "cuda"  # Will fail if GPU unavailable
-        elif self.cpu_fallback_allowed:
-            device = "cuda"  # Will fallback to CPU if unavailable
-        else:
-            device = "cpu"  # Explicit CPU only
 
-        return {
-            "model_type": self.model_type,
-            "model_path": self.model_path,
-            "device": device,
-            "input_size": self.expected_resolution,
-            "confidence_threshold": self.confidence_threshold,
-            "nms_iou_threshold": self.nms_iou_threshold,
-        }
+        The values are computed once at construction; each call returns a
+        new (shallow) copy, so callers may modify it freely.
+        """
+        return dict(self._runtime_config)
 
     def __repr__(self) -> str:
         return (
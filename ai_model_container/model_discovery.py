@@ -25,12 +25,16 @@ WHAT THIS IS NOT:
 - Runtime configuration updates
 """
 
+import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from .model_config import ModelConfig
 
+logger = logging.getLogger(__name__)
+
 
 class ModelDiscovery:
     """
@@ -45,6 +49,13 @@ class ModelDiscovery:
     NO runtime discovery occurs.
     """
 
+    __slots__ = (
+        "models_dir",
+        "_discovered_models",
+        "_unavailable_models",
+        "_available_ids",
+    )
+
     # Fixed discovery path (LOCKED)
     DEFAULT_MODELS_DIR = "/opt/ruth-ai/models"
 
@@ -58,15 +69,24 @@ class ModelDiscovery:
         self.models_dir = models_dir or self.DEFAULT_MODELS_DIR
         self._discovered_models: Dict[str, ModelConfig] = {}
         self._unavailable_models: Dict[str, str] = {}  # model_id -> reason
+        self._available_ids: Tuple[str, ...] = ()  # Fixed after discovery
 
-    def discover_models(self) -> Dict[str, ModelConfig]:
+    def discover_models(self, model_id: Optional[str] = None) -> Mapping[str, ModelConfig]:
         """
         Discover all models in models directory.
 
         This is called ONCE at container startup.
 
+        Args:
+            model_id: Optional; only discover this model. Other models are
+                      recognized from their model.yaml header
+                      (ModelConfig.peek_header) and skipped without full
+                      validation. Models whose header cannot be read are
+                      still fully validated (and marked UNAVAILABLE).
+
         Returns:
-            Dict mapping model_id to ModelConfig for AVAILABLE models
+            Read-only mapping (MappingProxyType view, no copy) of
+            model_id to ModelConfig for AVAILABLE models
 
         DISCOVERY ALGORITHM:
         1. Check if models_dir exists
@@ -84,71 +104,108 @@ class ModelDiscovery:
         - Missing weights → model UNAVAILABLE
         - No exceptions raised (fail silently)
         """
-        print(f"Discovering models in: {self.models_dir}")
+        logger.info("Discovering models in: %s", self.models_dir)
 
         # Check if models directory exists
         if not os.path.exists(self.models_dir):
-            print(f"WARNING: Models directory does not exist: {self.models_dir}")
-            print(f"         No models will be available.")
-            return {}
+            logger.warning(
+                "Models directory does not exist: %s. No models will be available.",
+                self.models_dir,
+            )
+            return MappingProxyType(self._discovered_models)
 
         if not os.path.isdir(self.models_dir):
-            print(f"ERROR: Models path is not a directory: {self.models_dir}")
-            return {}
+            logger.error("Models path is not a directory: %s", self.models_dir)
+            return MappingProxyType(self._discovered_models)
 
         # Scan subdirectories
         try:
-            entries = os.listdir(self.models_dir)
+            with os.scandir(self.models_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
         except PermissionError:
-            print(f"ERROR: Permission denied reading models directory: {self.models_dir}")
-            return {}
+            logger.error("Permission denied reading models directory: %s", self.models_dir)
+            return MappingProxyType(self._discovered_models)
         except Exception as e:
-            print(f"ERROR: Failed to list models directory: {e}")
-            return {}
-
-        # Discover each model
-        for entry in sorted(entries):
-            model_dir = os.path.join(self.models_dir, entry)
-
-            # Skip if not a directory
-            if not os.path.isdir(model_dir):
-                continue
+            logger.error("Failed to list models directory: %s", e)
+            return MappingProxyType(self._discovered_models)
+
+        # Open the models directory once so weights checks can stat
+        # relative to it (best-effort; falls back to full paths)
+        dir_fd = None
+        if os.stat in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(
+                    self.models_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+                )
+            except OSError:
+                dir_fd = None
 
-            # Look for model.yaml
-            yaml_path = os.path.join(model_dir, "model.yaml")
-
-            if not os.path.exists(yaml_path):
-                print(f"WARNING: model.yaml not found in {model_dir}")
-                print(f"         Model '{entry}' marked UNAVAILABLE")
-                self._unavailable_models[entry] = "missing_model_yaml"
-                continue
-
-            # Parse model.yaml
-            model_config = ModelConfig.from_yaml_file(yaml_path, model_dir)
-
-            if model_config is None:
-                print(f"WARNING: Invalid model.yaml in {model_dir}")
-                print(f"         Model '{entry}' marked UNAVAILABLE")
-                self._unavailable_models[entry] = "invalid_model_yaml"
-                continue
-
-            # Model is AVAILABLE
-            print(f"✓ Discovered model: {model_config.model_id} ({model_config.model_name} v{model_config.model_version})")
-            print(f"  Path: {model_config.model_path}")
-            print(f"  Type: {model_config.model_type}")
-            print(f"  GPU required: {model_config.gpu_required}")
-            print(f"  CPU fallback: {model_config.cpu_fallback_allowed}")
-
-            self._discovered_models[model_config.model_id] = model_config
+        try:
+            # Discover each model
+            for dir_entry in entries:
+                entry = dir_entry.name
+                model_dir = os.path.join(self.models_dir, entry)
+
+                # Skip if not a directory (DirEntry caches the type from scandir)
+                if not dir_entry.is_dir():
+                    continue
+
+                # Look for model.yaml
+                yaml_path = os.path.join(model_dir, "model.yaml")
+
+                if not os.path.exists(yaml_path):
+                    logger.warning(
+                        "model.yaml not found in %s. Model %r marked UNAVAILABLE",
+                        model_dir, entry,
+                    )
+                    self._unavailable_models[entry] = "missing_model_yaml"
+                    continue
+
+                # Another model than the one requested: skip full parse
+                if model_id is not None:
+                    header = ModelConfig.peek_header(yaml_path)
+                    if header is not None and header[0] != model_id:
+                        continue
+
+                # Parse model.yaml
+                model_config = ModelConfig.from_yaml_file(yaml_path, model_dir, dir_fd=dir_fd)
+
+                if model_config is None:
+                    logger.warning(
+                        "Invalid model.yaml in %s. Model %r marked UNAVAILABLE",
+                        model_dir, entry,
+                    )
+                    self._unavailable_models[entry] = "invalid_model_yaml"
+                    continue
+
+                # Model is AVAILABLE
+                logger.info(
+                    "Discovered model: %s (%s v%s) path=%s type=%s "
+                    "gpu_required=%s cpu_fallback=%s",
+                    model_config.model_id,
+                    model_config.model_name,
+                    model_config.model_version,
+                    model_config.model_path,
+                    model_config.model_type,
+                    model_config.gpu_required,
+                    model_config.cpu_fallback_allowed,
+                )
+
+                self._discovered_models[model_config.model_id] = model_config
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
         # Summary
+        self._available_ids = tuple(self._discovered_models)
         available_count = len(self._discovered_models)
         unavailable_count = len(self._unavailable_models)
-        print(f"\nModel discovery complete:")
-        print(f"  Available: {available_count}")
-        print(f"  Unavailable: {unavailable_count}")
+        logger.info(
+            "Model discovery complete: available=%d unavailable=%d",
+            available_count, unavailable_count,
+        )
 
-        return self._discovered_models
+        return MappingProxyType(self._discovered_models)
 
     def get_model(self, model_id: str) -> Optional[ModelConfig]:
         """
@@ -162,14 +219,15 @@ class ModelDiscovery:
         """
         return self._discovered_models.get(model_id)
 
-    def list_available_models(self) -> List[str]:
+    def list_available_models(self) -> Tuple[str, ...]:
         """
         List IDs of all available models.
 
         Returns:
-            List of model IDs
+            Tuple of model IDs (computed once at discovery; discovery
+            does not change after startup)
         """
-        return list(self._discovered_models.keys())
+        return self._available_ids
 
     def is_available(self, model_id: str) -> bool:
         """
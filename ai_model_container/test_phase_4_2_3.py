@@ -88,11 +88,55 @@ output_schema:
         print(f"  CPU Fallback: {config.cpu_fallback_allowed}")
         print(f"  Model Path: {config.model_path}")
 
+        # Optional metadata is parsed by default
+        if (config.description, config.author, config.license) != (
+            "Test model for validation", "Test Author", "MIT"
+        ):
+            print(f"✗ FAIL: Metadata not parsed: {config.description!r}, "
+                  f"{config.author!r}, {config.license!r}")
+            return False
+
         # Test runtime config conversion
         print("\nConverting to runtime config...")
         runtime_config = config.to_runtime_config()
         print(f"✓ PASS: Runtime config: {runtime_config}")
 
+        # Callers get their own copy
+        runtime_config["device"] = "mutated"
+        if config.to_runtime_config()["device"] == "mutated":
+            print("✗ FAIL: Runtime config mutation leaked into ModelConfig")
+            return False
+
+        # Test header-only peek
+        print("\nPeeking model.yaml header...")
+        header = ModelConfig.peek_header(yaml_path)
+        if header != ("test_yolov8n", "1.0.0"):
+            print(f"✗ FAIL: Unexpected header: {header}")
+            return False
+
+        # Header cut short: must fall back to a full parse
+        header = ModelConfig.peek_header(yaml_path, max_bytes=16)
+        if header != ("test_yolov8n", "1.0.0"):
+            print(f"✗ FAIL: Unexpected header with small max_bytes: {header}")
+            return False
+
+        print(f"✓ PASS: Header: {header}")
+
+        # Empty model_dir keeps the weights path relative
+        print("\nParsing with an empty model_dir...")
+        cwd = os.getcwd()
+        os.chdir(model_dir)
+        try:
+            config = ModelConfig.from_yaml_file(yaml_path, "")
+        finally:
+            os.chdir(cwd)
+
+        if config is None or config.model_path != "weights/test.pt":
+            print(f"✗ FAIL: Unexpected model path: {config and config.model_path}")
+            return False
+
+        print(f"✓ PASS: Model Path: {config.model_path}")
+
     return True
 
 
@@ -318,6 +362,22 @@ output_schema:
 
         print("✓ PASS: Discovery methods working correctly")
 
+        # Discovery for a single model skips the others by header
+        print("\nDiscovering only model2...")
+        discovery = ModelDiscovery(models_dir=models_dir)
+        available_models = discovery.discover_models("model2")
+
+        if set(available_models) != {"model2"}:
+            print(f"✗ FAIL: Expected only model2, got {set(available_models)}")
+            return False
+
+        # Unreadable headers still get fully validated
+        if discovery.get_unavailable_reason("model4") != "invalid_model_yaml":
+            print("✗ FAIL: model4 should still be marked invalid")
+            return False
+
+        print("✓ PASS: Single-model discovery working correctly")
+
     return True
 
 
@@ -10,28 +10,54 @@ Phase 8.1 Constraints:
 - Idempotent operations
 - No execution or reconciliation logic
 
+Phase 8.2 support:
+- Mutations trigger the in-process reconciliation service so it reacts
+  without waiting for its next poll (best-effort, polling still runs)
+
 CRITICAL: These APIs store INTENT only, not execution state.
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+import hashlib
+import json
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 from loguru import logger
 
 from database import get_db
 from app.models import AIModelAssignment, Device
+from app.services.reconciliation_service_manager import reconciliation_manager
 from app.schemas.ai_model_assignment import (
     AIModelAssignmentCreate,
     AIModelAssignmentUpdate,
     AIModelAssignmentResponse,
-    AIModelAssignmentListResponse
+    AIModelAssignmentListResponse,
+    AIModelAssignmentDigestResponse
 )
 
 
 router = APIRouter(prefix="/api/v1/ai-model-assignments", tags=["ai-model-assignments"])
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+
 @router.post("", response_model=AIModelAssignmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_assignment(
     assignment_data: AIModelAssignmentCreate,
@@ -114,6 +140,8 @@ async def create_assignment(
             f"model={assignment.model_id} enabled={assignment.enabled}"
         )
 
+        reconciliation_manager.trigger()
+
         return AIModelAssignmentResponse.from_orm(assignment)
 
     except HTTPException:
@@ -127,6 +155,65 @@ async def create_assignment(
         )
 
 
+@router.get("/digests", response_model=AIModelAssignmentDigestResponse)
+async def list_assignment_digests(
+    enabled: Optional[bool] = Query(None, description="Filter by enabled state"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Per-camera content digests of assignments (Phase 8.2 support).
+
+    Each digest is a SHA-256 over the camera's (model_id, desired_fps,
+    priority, parameters) tuples, sorted by model_id. It changes whenever
+    any of those fields change for that camera, so reconciliation can
+    fetch full assignments only for cameras whose digest moved.
+
+    Query parameters:
+        enabled: Optional boolean to filter by enabled state
+
+    Returns:
+        AIModelAssignmentDigestResponse mapping camera_id -> digest
+        (cameras without matching assignments are absent)
+
+    Phase 8.1 Constraints:
+    - Read-only operation
+    - Returns intent state, not execution state
+    """
+    try:
+        query = select(
+            AIModelAssignment.camera_id,
+            AIModelAssignment.model_id,
+            AIModelAssignment.desired_fps,
+            AIModelAssignment.priority,
+            AIModelAssignment.parameters,
+        )
+        if enabled is not None:
+            query = query.where(AIModelAssignment.enabled == enabled)
+
+        result = await db.execute(query)
+
+        # Group assignment content by camera
+        by_camera: Dict[str, List[List[Any]]] = {}
+        for row in result.all():
+            by_camera.setdefault(str(row.camera_id), []).append(
+                [row.model_id, row.desired_fps, row.priority, row.parameters]
+            )
+
+        digests = {}
+        for camera_id, entries in by_camera.items():
+            entries.sort(key=lambda entry: entry[0])
+            payload = json.dumps(entries, sort_keys=True, separators=(",", ":"), default=str)
+            digests[camera_id] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+        return AIModelAssignmentDigestResponse(digests=digests)
+
+    except Exception as e:
+        logger.error(f"Failed to compute assignment digests: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compute assignment digests: {str(e)}"
+        )
+
+
 @router.get("/{assignment_id}", response_model=AIModelAssignmentResponse)
 async def get_assignment(
     assignment_id: UUID,
@@ -174,6 +261,8 @@ async def get_assignment(
 
 @router.get("", response_model=AIModelAssignmentListResponse)
 async def list_assignments(
+    request: Request,
+    response: Response,
     camera_id: Optional[UUID] = Query(None, description="Filter by camera/device UUID"),
     model_id: Optional[str] = Query(None, description="Filter by model identifier"),
     enabled: Optional[bool] = Query(None, description="Filter by enabled state"),
@@ -197,6 +286,10 @@ async def list_assignments(
         - limit: Limit applied to this query
         - offset: Offset applied to this query
 
+    Conditional GET (Phase 8.2 support):
+        The response carries an ETag over its content. A request whose
+        If-None-Match matches it gets 304 Not Modified with no body.
+
     Phase 8.1 Constraints:
     - Read-only operation
     - Returns intent state, not execution state
@@ -231,13 +324,26 @@ async def list_assignments(
         result = await db.execute(query)
         assignments = result.scalars().all()
 
-        return AIModelAssignmentListResponse(
+        list_response = AIModelAssignmentListResponse(
             assignments=[AIModelAssignmentResponse.from_orm(a) for a in assignments],
             total=total,
             limit=limit,
             offset=offset
         )
 
+        # Content ETag (assignments include updated_at, so any change moves it)
+        payload = json.dumps(
+            list_response.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+        )
+        etag = f'"{hashlib.sha256(payload.encode("utf-8")).hexdigest()}"'
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+
+        return list_response
+
     except Exception as e:
         logger.error(f"Failed to list assignments: {e}")
         raise HTTPException(
@@ -303,6 +409,8 @@ async def update_assignment(
             f"model={assignment.model_id} enabled={assignment.enabled}"
         )
 
+        reconciliation_manager.trigger()
+
         return AIModelAssignmentResponse.from_orm(assignment)
 
     except HTTPException:
@@ -369,6 +477,8 @@ async def delete_assignment(
             f"model={assignment.model_id}"
         )
 
+        reconciliation_manager.trigger()
+
     except HTTPException:
         raise
     except Exception as e:
@@ -82,3 +82,12 @@ class AIModelAssignmentListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class AIModelAssignmentDigestResponse(BaseModel):
+    """Schema for per-camera assignment content digests.
+
+    Phase 8.2: Lets Ruth AI Core reconciliation skip cameras whose
+    assignments are unchanged since its last cycle.
+    """
+    digests: Dict[str, str] = Field(..., description="camera_id -> SHA-256 of the camera's assignments")
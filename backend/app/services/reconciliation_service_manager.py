@@ -201,6 +201,23 @@ class ReconciliationServiceManager:
                 f"Error stopping Ruth AI Core reconciliation service (Phase 8.2): {e}"
             )
 
+        # Release the assignment client's pooled HTTP connections
+        if self.assignment_client is not None:
+            await self.assignment_client.close()
+
+    def trigger(self) -> None:
+        """
+        Request a reconciliation cycle now (e.g. after an assignment change).
+
+        Best-effort and non-blocking: a no-op if reconciliation is not
+        initialized or not running. Only reaches this process's service;
+        other workers pick the change up on their next poll.
+        """
+        if not self._initialized or self.reconciliation_service is None:
+            return
+
+        self.reconciliation_service.trigger()
+
     def is_running(self) -> bool:
         """Check if reconciliation service is running."""
         if not self._initialized or self.reconciliation_service is None:
@@ -57,6 +57,7 @@ CRITICAL CONSTRAINTS (UNCHANGED):
 - Shared memory is READ-ONLY (no mutations)
 """
 
+import gc
 import os
 import sys
 import threading
@@ -142,6 +143,7 @@ class InferenceHandler:
 
         # Model state (immutable after __init__)
         self._model = None
+        self._torch = None  # torch module handle, set by _load_pytorch_model
         self._model_type = self.model_config["model_type"]
         self._model_path = self.model_config["model_path"]
 
@@ -260,6 +262,9 @@ class InferenceHandler:
         except ImportError as e:
             raise RuntimeError("PyTorch not available. Install with: pip install torch") from e
 
+        # Keep the module handle so cleanup() does not re-import torch
+        self._torch = torch
+
         try:
             # Load model weights
             # This assumes model_path points to a .pt or .pth file
@@ -393,6 +398,9 @@ class InferenceHandler:
             # Catch all exceptions and return error response
             # NEVER raise exceptions from handler
             is_error = True
+            # Return cached allocator blocks so failures (e.g. CUDA OOM)
+            # do not leave fragmentation behind for later requests
+            self._release_cuda_cache()
             return InferenceResponse(
                 model_id=self.model_id,
                 camera_id=request.camera_id,
@@ -408,6 +416,24 @@ class InferenceHandler:
             inference_time_ms = (time.time() - start_time) * 1000
             self._update_metrics(inference_time_ms, is_error)
 
+    def _release_cuda_cache(self) -> None:
+        """
+        Best-effort release of cached CUDA allocator blocks.
+
+        Only applies to PyTorch models running on a CUDA device.
+        MUST NOT raise exceptions (called from the error path).
+        """
+        torch = self._torch
+        if torch is None or not self._device.startswith("cuda"):
+            return
+
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            # Silently ignore - allocator cleanup is best-effort
+            pass
+
     def _validate_frame_reference(self, frame_reference: str) -> bool:
         """
         Validate frame reference path.
@@ -530,7 +556,7 @@ class InferenceHandler:
         # Preprocess for model
         # Get target size from config, default to 640x640
         target_size = self.model_config.get("input_size", [640, 640])
-        if isinstance(target_size, list) and len(target_size) == 2:
+        if isinstance(target_size, (list, tuple)) and len(target_size) == 2:
             target_size = tuple(target_size)
         else:
             target_size = (640, 640)
@@ -620,7 +646,7 @@ class InferenceHandler:
 
         # Preprocess for model
         target_size = self.model_config.get("input_size", [640, 640])
-        if isinstance(target_size, list) and len(target_size) == 2:
+        if isinstance(target_size, (list, tuple)) and len(target_size) == 2:
             target_size = tuple(target_size)
         else:
             target_size = (640, 640)
@@ -870,12 +896,19 @@ class InferenceHandler:
 
         if self._model is not None:
             # PyTorch cleanup
-            if self._model_type == "pytorch":
+            if self._model_type == "pytorch" and self._torch is not None:
                 try:
-                    import torch
-                    # Move model to CPU and clear CUDA cache
+                    torch = self._torch
+                    # Release the model and clear CUDA cache
                     if self._device == "cuda":
-                        self._model = self._model.to("cpu")
+                        # Drop the last reference and collect so tensors held
+                        # by reference cycles are actually freed (no copy to
+                        # host memory first: the weights are discarded)
+                        self._model = None
+                        gc.collect()
+                        # Wait for queued kernels; in-flight work keeps its
+                        # tensors alive until completion
+                        torch.cuda.synchronize()
                         torch.cuda.empty_cache()
                         print("GPU memory released")
                 except Exception as e:
@@ -21,6 +21,7 @@ PHASE 3.2 EXPORTS:
 PHASE 3.3 EXPORTS:
 - StreamAgent.should_dispatch: FPS gating decision logic
 - StreamAgent.record_dispatch: Dispatch state update
+- StreamAgent.try_dispatch: Gating decision + dispatch update in one call
 
 PHASE 3.4 ADDITIONS:
 - Defensive guards for STOPPED state
@@ -50,13 +51,36 @@ CONSTRAINTS:
 This is decision logic only, not execution.
 """
 
+import importlib
+
 from .agent import StreamAgent
 from .subscription import Subscription
 from .types import AgentState
-from .assignment_client import AssignmentClient
-from .agent_registry import AgentRegistry
-from .reconciliation import ReconciliationEngine
-from .reconciliation_service import ReconciliationService
+
+# Phase 8.2 exports pull in aiohttp/loguru and the reconciliation stack.
+# They are imported on first attribute access (PEP 562) so consumers that
+# only need the Phase 3 state model do not pay for them.
+_LAZY_EXPORTS = {
+    "AssignmentClient": ".assignment_client",
+    "AgentRegistry": ".agent_registry",
+    "ReconciliationEngine": ".reconciliation",
+    "ReconciliationService": ".reconciliation_service",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "StreamAgent",
@@ -55,13 +55,186 @@ WHAT THIS IS NOT:
 - Not integrated with VAS Kernel yet
 """
 
+import math
+import sys
+import threading
+import warnings
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from .subscription import Subscription
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from .clock import datetime_to_monotonic_ns, monotonic_ns_to_datetime, now_ns
+from .subscription import (
+    DROP_FPS_GATE,
+    DROP_INACTIVE,
+    DROP_INVALID_FPS,
+    DROP_STOPPED,
+    Subscription,
+)
 from .types import AgentState
 
 
+# Internal lifecycle state codes. StreamAgent stores a plain int so the
+# per-frame STOPPED guard is an int compare instead of Enum __eq__;
+# AgentState is only materialized at the API boundary (state property).
+_CREATED = 0
+_RUNNING = 1
+_STOPPED = 2
+
+# Index = internal state code
+_STATE_ENUMS = (AgentState.CREATED, AgentState.RUNNING, AgentState.STOPPED)
+
+# Valid lifecycle transitions: (current state, action) -> next state.
+# See AgentState: CREATED -> RUNNING (start), RUNNING -> STOPPED (stop).
+_TRANSITIONS: Dict[Tuple[int, str], int] = {
+    (_CREATED, "start"): _RUNNING,
+    (_RUNNING, "stop"): _STOPPED,
+}
+
+# Required source state per action (error messages only)
+_TRANSITION_SOURCES: Dict[str, int] = {
+    action: state for (state, action) in _TRANSITIONS
+}
+
+
+def _as_frame_ns(frame_timestamp: Union[int, datetime]) -> int:
+    """
+    Normalize a frame timestamp to monotonic integer nanoseconds.
+
+    Integers are passed through unchanged (fast path). datetime values are
+    still accepted for backward compatibility but are deprecated.
+    """
+    if type(frame_timestamp) is int:
+        return frame_timestamp
+
+    if isinstance(frame_timestamp, datetime):
+        warnings.warn(
+            "Passing a datetime frame_timestamp is deprecated; "
+            "pass time.monotonic_ns() integer nanoseconds instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        return datetime_to_monotonic_ns(frame_timestamp)
+
+    raise TypeError(
+        f"frame_timestamp must be int nanoseconds, got {type(frame_timestamp).__name__}"
+    )
+
+
+def _legacy_frame_timestamp(frame_id: Any, frame_timestamp: Union[int, datetime]) -> Union[int, datetime]:
+    """
+    Resolve the deprecated (frame_id, frame_timestamp) gating call form.
+
+    FPS gating used to take a frame_id before the timestamp. It was never
+    used for the decision and is ignored; the call still works but warns.
+    """
+    warnings.warn(
+        "Passing frame_id to FPS gating is deprecated and ignored; "
+        "pass only frame_timestamp",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return frame_timestamp
+
+
+def _gate_unlimited(subscription: Subscription, frame_ns: int) -> bool:
+    """
+    Phase 3.3: FPS gate for subscriptions without desired_fps.
+
+    Only the (mutable) active flag is checked; there is no interval to
+    enforce. The agent-level STOPPED guard is the caller's.
+
+    Returns:
+        True to ALLOW, False to SKIP (drop counter incremented)
+    """
+    # Fail-closed: inactive subscriptions never receive frames
+    if subscription.active:
+        return True
+
+    # Phase 7: Track drop (best-effort, silent failure)
+    subscription._increment_drop_count(DROP_INACTIVE)
+    return False
+
+
+def _gate_invalid(subscription: Subscription, frame_ns: int) -> bool:
+    """
+    Phase 3.4: FPS gate for subscriptions with an invalid desired_fps.
+
+    Fail-closed: every frame is skipped.
+
+    Returns:
+        False (SKIP, drop counter incremented)
+    """
+    # Phase 7: Track drop (best-effort, silent failure)
+    # (inactive takes precedence as the reported reason)
+    subscription._increment_drop_count(
+        DROP_INVALID_FPS if subscription.active else DROP_INACTIVE
+    )
+    return False
+
+
+def _make_fps_capped_gate(min_interval_ns: float) -> Callable[[Subscription, int], bool]:
+    """
+    Phase 3.3: Build the FPS gate for a subscription with a valid desired_fps.
+
+    The minimum interval is captured as a default argument (fast local)
+    instead of being read from the subscription on every frame.
+    """
+    def _gate_fps_capped(
+        subscription: Subscription,
+        frame_ns: int,
+        _min_interval_ns: float = min_interval_ns,
+    ) -> bool:
+        # Fail-closed: inactive subscriptions never receive frames
+        if subscription.active:
+            # First frame for this subscription → always allow.
+            # Otherwise allow if sufficient time has elapsed since last
+            # dispatch (integer subtract, >= for exact timing).
+            last_dispatch_ns = subscription.last_dispatch_ns
+            if last_dispatch_ns is None or frame_ns - last_dispatch_ns >= _min_interval_ns:
+                return True
+
+            # Phase 7: Track drop if frame is skipped (best-effort, silent failure)
+            subscription._increment_drop_count(DROP_FPS_GATE)
+            return False
+
+        # Phase 7: Track drop (best-effort, silent failure)
+        subscription._increment_drop_count(DROP_INACTIVE)
+        return False
+
+    return _gate_fps_capped
+
+
+def _make_gate(subscription: Subscription) -> Callable[[Subscription, int], bool]:
+    """
+    Phase 3.3: Build the FPS gate for a subscription once, at creation.
+
+    The desired_fps branches (unlimited / invalid / capped) are resolved
+    here instead of on every frame.
+    """
+    min_interval_ns = subscription._min_interval_ns
+
+    # If no FPS limit configured, allow all frames
+    if min_interval_ns is None:
+        return _gate_unlimited
+
+    # Validate desired_fps (fail-closed on invalid config)
+    if min_interval_ns == math.inf:
+        return _gate_invalid
+
+    return _make_fps_capped_gate(min_interval_ns)
+
+
+def _bind_gate(subscription: Subscription) -> Callable[[Subscription, int], bool]:
+    """
+    Bind the FPS gate of a subscription created outside this agent.
+
+    Subscriptions from add_subscription()/apply_subscriptions() are bound
+    at creation; a directly constructed Subscription is bound on first use.
+    """
+    gate = subscription._gate = _make_gate(subscription)
+    return gate
+
+
 class StreamAgent:
     """
     Logical orchestration unit for one camera stream.
@@ -98,6 +271,24 @@ class StreamAgent:
     - Explicit failure isolation semantics
     """
 
+    # One agent per camera: no per-instance __dict__, and attribute loads
+    # on the should_dispatch path go through slot descriptors.
+    __slots__ = (
+        "camera_id",
+        "_state",
+        "frame_source_path",
+        "_sub_list",
+        "_sub_index",
+        "_model_id_set",
+        "_config_pairs",
+        "created_ns",
+        "started_ns",
+        "stopped_ns",
+        "_frame_counter",
+        "_dispatch_counter",
+        "_state_lock",
+    )
+
     def __init__(self, camera_id: str, frame_source_path: Optional[str] = None):
         """
         Initialize a StreamAgent for the given camera.
@@ -111,15 +302,19 @@ class StreamAgent:
 
         State after construction:
             - state = CREATED
-            - subscriptions = empty dict
-            - created_at = current timestamp
+            - subscriptions = none (storage allocated on first add)
+            - created_ns = current monotonic timestamp
             - frame_source_path = logical reference (if provided)
         """
         # Core identity: stream_agent_id == camera_id
+        # Interned: the same id keys the registry, reconciliation and
+        # metrics, so lookups compare by identity first.
+        if type(camera_id) is str:
+            camera_id = sys.intern(camera_id)
         self.camera_id: str = camera_id
 
-        # Lifecycle state
-        self.state: AgentState = AgentState.CREATED
+        # Lifecycle state (internal int code, see _STATE_ENUMS)
+        self._state: int = _CREATED
 
         # Phase 3.2: Logical frame source binding
         # This is a REFERENCE ONLY - no file access, no memory mapping
@@ -131,18 +326,74 @@ class StreamAgent:
         self.frame_source_path: Optional[str] = frame_source_path
 
         # Phase 3.2: Subscription storage
-        # Dict[model_id, Subscription] for O(1) lookup
-        self._subscriptions: Dict[str, Subscription] = {}
+        # Flat list is the canonical storage (iterated per frame);
+        # Dict[model_id, list index] gives O(1) lookup and O(1) removal.
+        # Both are allocated on the first add_subscription(): idle cameras
+        # (no subscribers yet) hold no empty containers.
+        self._sub_list: Optional[List[Subscription]] = None
+        self._sub_index: Optional[Dict[str, int]] = None
+
+        # Phase 8.2: frozenset of subscribed model_ids for reconciliation,
+        # rebuilt lazily (None = stale) after add/remove
+        self._model_id_set: Optional[FrozenSet[str]] = None
+
+        # Phase 8.2: frozenset of (model_id, config hash) pairs, rebuilt
+        # lazily (None = stale) after add/remove/config update
+        self._config_pairs: Optional[FrozenSet[Tuple[str, int]]] = None
 
         # Inert metadata (no logic attached)
-        self.created_at: datetime = datetime.utcnow()
-        self.started_at: Optional[datetime] = None
-        self.stopped_at: Optional[datetime] = None
+        # Monotonic integer nanoseconds (see clock.py); datetimes are only
+        # materialized by the created_at/started_at/stopped_at properties
+        self.created_ns: int = now_ns()
+        self.started_ns: Optional[int] = None
+        self.stopped_ns: Optional[int] = None
 
         # Optional counters for future phases (inert for now)
         self._frame_counter: int = 0
         self._dispatch_counter: int = 0
 
+        # Serializes start()/stop() so concurrent callers cannot interleave
+        # the check-and-set of a transition. Dispatch paths only read
+        # _state (a single int load) and take no lock.
+        self._state_lock = threading.Lock()
+
+    @property
+    def state(self) -> AgentState:
+        """Lifecycle state (read-only; use start()/stop() to transition)."""
+        return _STATE_ENUMS[self._state]
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a naive UTC datetime (derived from created_ns)."""
+        return monotonic_ns_to_datetime(self.created_ns)
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Start time as a naive UTC datetime, or None if never started."""
+        return monotonic_ns_to_datetime(self.started_ns)
+
+    @property
+    def stopped_at(self) -> Optional[datetime]:
+        """Stop time as a naive UTC datetime, or None if never stopped."""
+        return monotonic_ns_to_datetime(self.stopped_ns)
+
+    def _transition(self, action: str) -> None:
+        """
+        Apply a lifecycle transition from _TRANSITIONS.
+
+        Raises:
+            RuntimeError: If the action is not valid in the current state
+        """
+        next_state = _TRANSITIONS.get((self._state, action))
+        if next_state is None:
+            # Failure path only: message is built here, not per call
+            raise RuntimeError(
+                f"Cannot {action} agent in state {self.state.value}. "
+                f"Expected {_STATE_ENUMS[_TRANSITION_SOURCES[action]].value}."
+            )
+
+        self._state = next_state
+
     def start(self) -> None:
         """
         Transition agent from CREATED to RUNNING.
@@ -159,14 +410,9 @@ class StreamAgent:
         Raises:
             RuntimeError: If agent is not in CREATED state
         """
-        if self.state != AgentState.CREATED:
-            raise RuntimeError(
-                f"Cannot start agent in state {self.state.value}. "
-                f"Expected {AgentState.CREATED.value}."
-            )
-
-        self.state = AgentState.RUNNING
-        self.started_at = datetime.utcnow()
+        with self._state_lock:
+            self._transition("start")
+            self.started_ns = now_ns()
 
     def stop(self) -> None:
         """
@@ -183,14 +429,9 @@ class StreamAgent:
         Raises:
             RuntimeError: If agent is not in RUNNING state
         """
-        if self.state != AgentState.RUNNING:
-            raise RuntimeError(
-                f"Cannot stop agent in state {self.state.value}. "
-                f"Expected {AgentState.RUNNING.value}."
-            )
-
-        self.state = AgentState.STOPPED
-        self.stopped_at = datetime.utcnow()
+        with self._state_lock:
+            self._transition("stop")
+            self.stopped_ns = now_ns()
 
     def add_subscription(self, model_id: str, config: Optional[Dict[str, Any]] = None) -> Subscription:
         """
@@ -216,10 +457,17 @@ class StreamAgent:
         if not model_id:
             raise ValueError("model_id must be non-empty")
 
-        if model_id in self._subscriptions:
-            raise ValueError(
-                f"Subscription for model_id={model_id!r} already exists on camera {self.camera_id!r}"
-            )
+        # Interned: the same model_id recurs across many cameras, so all
+        # subscriptions share one string object (non-str is rejected by
+        # Subscription validation below)
+        if type(model_id) is str:
+            model_id = sys.intern(model_id)
+
+        if self._sub_index is None:
+            self._sub_list = []
+            self._sub_index = {}
+        elif model_id in self._sub_index:
+            self._raise_duplicate(model_id)
 
         # Create subscription (pure state, no side effects)
         subscription = Subscription(
@@ -227,11 +475,23 @@ class StreamAgent:
             config=config or {}
         )
 
-        # Store in subscriptions dict
-        self._subscriptions[model_id] = subscription
+        # Phase 3.3: Bind the FPS gate for this subscription's config
+        subscription._gate = _make_gate(subscription)
+
+        # Store in subscription list and index
+        self._sub_index[model_id] = len(self._sub_list)
+        self._sub_list.append(subscription)
+        self._model_id_set = None
+        self._config_pairs = None
 
         return subscription
 
+    def _raise_duplicate(self, model_id: str) -> None:
+        """Raise the add_subscription() duplicate error (failure path only)."""
+        raise ValueError(
+            f"Subscription for model_id={model_id!r} already exists on camera {self.camera_id!r}"
+        )
+
     def remove_subscription(self, model_id: str) -> None:
         """
         Remove a model subscription from this camera stream.
@@ -248,22 +508,179 @@ class StreamAgent:
         Raises:
             KeyError: If subscription does not exist
         """
-        if model_id not in self._subscriptions:
+        # Existence check and index removal in one hash lookup
+        # (indices are ints, so None means "not subscribed")
+        sub_index = self._sub_index
+        index = sub_index.pop(model_id, None) if sub_index is not None else None
+        if index is None:
             raise KeyError(
                 f"No subscription for model_id={model_id!r} on camera {self.camera_id!r}"
             )
 
+        self._model_id_set = None
+        self._config_pairs = None
+
         # Remove subscription (immediate, no draining)
-        del self._subscriptions[model_id]
+        # Swap with the last element and pop: O(1), no list shift
+        sub_list = self._sub_list
+        last = sub_list.pop()
+        if index < len(sub_list):
+            sub_list[index] = last
+            sub_index[last.model_id] = index
+
+    def apply_subscriptions(
+        self,
+        desired_configs: Dict[str, Any],
+        desired_hashes: Optional[Dict[str, Optional[int]]] = None,
+        build_config: Optional[Callable[[Any], Dict[str, Any]]] = None
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Phase 8.2: Align this agent's subscriptions with a desired set.
+
+        One call per camera instead of a list/add/remove/get round trip
+        per model:
+        - model_ids not in desired_configs are removed
+        - model_ids not yet subscribed are added
+        - model_ids whose config differs are replaced in place (new
+          Subscription, same list position; counters start fresh, as
+          with remove + add)
+
+        Same pure state semantics as add_subscription/remove_subscription.
+
+        Args:
+            desired_configs: Dict[model_id, config] of desired subscriptions
+                             (Dict[model_id, value] with build_config)
+            desired_hashes: Optional Dict[model_id, config_hash(config)]
+                            with the same keys as desired_configs.
+                            When a hash is given, config changes are
+                            detected by comparing it with the
+                            subscription's stored hash instead of
+                            comparing the config dicts.
+            build_config: Optional; desired_configs values are then
+                          passed through build_config(value) to get the
+                          config, and only for models that are added,
+                          updated or compared without a hash
+
+        Returns:
+            (added, removed, updated) model_id lists
+
+        Raises:
+            ValueError: If a desired model_id or config is invalid
+                        (changes applied before it are kept)
+        """
+        added: List[str] = []
+        removed: List[str] = []
+        updated: List[str] = []
+
+        # Steady state: every desired (model_id, hash) pair is already
+        # held, and nothing else is. One set comparison, no per-model work
+        # (a None hash is never in the pairs, so it takes the slow path).
+        # Hashless subscriptions are not in the pairs either: the length
+        # check keeps them from hiding behind an otherwise equal set.
+        if desired_hashes is not None:
+            config_pairs = self._get_config_pairs()
+            if (
+                len(config_pairs) == self.subscription_count
+                and config_pairs == desired_hashes.items()
+            ):
+                return added, removed, updated
+
+        # Same model_ids: only configs need checking
+        model_id_set = self.get_model_id_set()
+        if model_id_set != desired_configs.keys():
+            removed = [m for m in model_id_set if m not in desired_configs]
+            for model_id in removed:
+                self.remove_subscription(model_id)
+
+        for model_id, config in desired_configs.items():
+            sub_index = self._sub_index
+            index = sub_index.get(model_id) if sub_index is not None else None
+
+            if index is None:
+                if build_config is not None:
+                    config = build_config(config)
+                self.add_subscription(model_id, config)
+                added.append(model_id)
+                continue
+
+            current = self._sub_list[index]
+
+            desired_hash = desired_hashes.get(model_id) if desired_hashes is not None else None
+            if desired_hash is not None and current._config_hash is not None:
+                changed = current._config_hash != desired_hash
+                if changed and build_config is not None:
+                    config = build_config(config)
+            else:
+                if build_config is not None:
+                    config = build_config(config)
+                changed = current.config != config
+
+            if changed:
+                # Reuse the interned model_id of the existing subscription
+                subscription = Subscription(model_id=current.model_id, config=config or {})
+                subscription._gate = _make_gate(subscription)
+                self._sub_list[index] = subscription
+                self._config_pairs = None
+                updated.append(model_id)
+
+        return added, removed, updated
+
+    def _get_config_pairs(self) -> FrozenSet[Tuple[str, int]]:
+        """
+        (model_id, config hash) pairs of all subscriptions, cached.
+
+        Subscriptions without a config hash are left out: a desired set
+        containing them never compares equal, and the pairs cover every
+        subscription only if their count equals subscription_count.
+        """
+        config_pairs = self._config_pairs
+        if config_pairs is None:
+            config_pairs = frozenset(
+                (subscription.model_id, subscription._config_hash)
+                for subscription in self._sub_list or ()
+                if subscription._config_hash is not None
+            )
+            self._config_pairs = config_pairs
+        return config_pairs
+
+    def get_model_id_set(self) -> FrozenSet[str]:
+        """
+        Get the model_ids of all subscriptions as a frozenset.
+
+        Returns:
+            Cached frozenset, shared between callers and rebuilt only
+            after a subscription is added or removed
+        """
+        model_id_set = self._model_id_set
+        if model_id_set is None:
+            model_id_set = frozenset(self._sub_index or ())
+            self._model_id_set = model_id_set
+        return model_id_set
 
     def list_subscriptions(self) -> List[Subscription]:
         """
         List all active subscriptions for this camera.
 
         Returns:
-            List of Subscription objects (read-only view)
+            The agent's internal subscription list (no copy). This is a
+            READ-ONLY view: do not mutate it, and do not hold it across
+            add_subscription()/remove_subscription() calls. Use
+            list_subscriptions_copy() when a stable snapshot is needed.
+        """
+        if self._sub_list is None:
+            return []
+        return self._sub_list
+
+    def list_subscriptions_copy(self) -> List[Subscription]:
+        """
+        Snapshot of all active subscriptions for this camera.
+
+        Returns:
+            New list of Subscription objects, safe to hold and mutate
         """
-        return list(self._subscriptions.values())
+        if self._sub_list is None:
+            return []
+        return self._sub_list.copy()
 
     def get_subscription(self, model_id: str) -> Optional[Subscription]:
         """
@@ -275,18 +692,28 @@ class StreamAgent:
         Returns:
             Subscription object if found, None otherwise
         """
-        return self._subscriptions.get(model_id)
+        if self._sub_index is None:
+            return None
+
+        index = self._sub_index.get(model_id)
+        if index is None:
+            return None
+        return self._sub_list[index]
 
     @property
     def subscription_count(self) -> int:
         """Number of active subscriptions."""
-        return len(self._subscriptions)
+        if self._sub_list is None:
+            return 0
+        return len(self._sub_list)
 
     def should_dispatch(
         self,
         subscription: Subscription,
-        frame_id: int,
-        frame_timestamp: datetime
+        frame_timestamp: int,
+        legacy_frame_timestamp: Optional[Union[int, datetime]] = None,
+        *,
+        frame_id: Any = None
     ) -> bool:
         """
         Phase 3.3: FPS gating decision logic.
@@ -328,8 +755,13 @@ class StreamAgent:
 
         Args:
             subscription: The subscription to evaluate
-            frame_id: Current frame identifier (monotonic)
-            frame_timestamp: Current frame timestamp
+            frame_timestamp: Current frame time as time.monotonic_ns()
+                             integer nanoseconds (datetime is deprecated)
+            legacy_frame_timestamp: Deprecated; only set by old
+                             (subscription, frame_id, frame_timestamp)
+                             calls, whose frame_id is ignored
+            frame_id: Deprecated keyword form of the same old call
+                      (frame_id=..., frame_timestamp=...); ignored
 
         Returns:
             True if frame should be dispatched (ALLOW)
@@ -338,60 +770,91 @@ class StreamAgent:
         Note:
             This method does NOT update subscription state.
             Caller must call record_dispatch() if dispatch succeeds.
+            Gating is timestamp-driven; the frame_id is only recorded by
+            record_dispatch().
         """
+        if legacy_frame_timestamp is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_timestamp, legacy_frame_timestamp)
+        elif frame_id is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_id, frame_timestamp)
+
+        # Common case first: agent not STOPPED and an int timestamp go
+        # straight to the subscription's bound gate
+        if self._state != _STOPPED:
+            if type(frame_timestamp) is not int:
+                frame_timestamp = _as_frame_ns(frame_timestamp)
+            gate = subscription._gate
+            if gate is None:
+                gate = _bind_gate(subscription)
+            return gate(subscription, frame_timestamp)
+
         # Phase 3.4: Defensive guard - STOPPED agents cannot make dispatch decisions
         # This enforces failure isolation: once stopped, agent is inert
-        if self.state == AgentState.STOPPED:
-            # Phase 7: Track drop (best-effort, silent failure)
-            subscription._increment_drop_count()
-            return False
-
-        # Fail-closed: inactive subscriptions never receive frames
-        if not subscription.active:
-            # Phase 7: Track drop (best-effort, silent failure)
-            subscription._increment_drop_count()
-            return False
+        # Phase 7: Track drop (best-effort, silent failure)
+        subscription._increment_drop_count(DROP_STOPPED)
+        return False
 
-        # Get desired_fps from config (default: None = unlimited)
-        desired_fps = subscription.config.get("desired_fps")
-
-        # If no FPS limit configured, allow all frames
-        if desired_fps is None:
-            return True
+    def should_dispatch_batch(
+        self,
+        frame_timestamp: int,
+        legacy_frame_timestamp: Optional[Union[int, datetime]] = None,
+        *,
+        frame_id: Any = None
+    ) -> List[Subscription]:
+        """
+        Phase 3.3: FPS gating decision for every subscription of this agent.
 
-        # Validate desired_fps (fail-closed on invalid config)
-        if not isinstance(desired_fps, (int, float)) or desired_fps <= 0:
-            # Phase 7: Track drop (best-effort, silent failure)
-            subscription._increment_drop_count()
-            return False
+        Equivalent to calling should_dispatch() for each subscription with
+        the same frame, but the agent-level STOPPED guard and timestamp
+        normalization run once per frame instead of once per subscription.
 
-        # First frame for this subscription → always allow
-        if subscription.last_dispatch_timestamp is None:
-            return True
+        Same semantics as should_dispatch():
+        - Pure decision logic, no dispatch, no state mutation
+        - SKIP decisions increment drop counters (best-effort)
+        - Caller must call record_dispatch() for each dispatched subscription
 
-        # Calculate minimum interval between frames (in seconds)
-        # desired_fps = frames per second
-        # min_interval = 1 / desired_fps
-        min_interval_seconds = 1.0 / float(desired_fps)
+        Args:
+            frame_timestamp: Current frame time as time.monotonic_ns()
+                             integer nanoseconds (datetime is deprecated)
+            legacy_frame_timestamp: Deprecated; only set by old
+                             (frame_id, frame_timestamp) calls, whose
+                             frame_id is ignored
+            frame_id: Deprecated keyword form of the same old call
+                      (frame_id=..., frame_timestamp=...); ignored
 
-        # Calculate time elapsed since last dispatch
-        elapsed = (frame_timestamp - subscription.last_dispatch_timestamp).total_seconds()
+        Returns:
+            Subscriptions that should receive the frame (ALLOW),
+            in subscription order
+        """
+        if legacy_frame_timestamp is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_timestamp, legacy_frame_timestamp)
+        elif frame_id is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_id, frame_timestamp)
 
-        # Allow dispatch if sufficient time has elapsed
-        # Use >= to handle edge cases with exact timing
-        should_allow = elapsed >= min_interval_seconds
+        subscriptions = self._sub_list
 
-        # Phase 7: Track drop if frame is skipped (best-effort, silent failure)
-        if not should_allow:
-            subscription._increment_drop_count()
+        # No subscribers yet (storage not allocated)
+        if subscriptions is None:
+            return []
 
-        return should_allow
+        # Phase 3.4: Defensive guard - STOPPED agents cannot make dispatch decisions
+        if self._state == _STOPPED:
+            for subscription in subscriptions:
+                # Phase 7: Track drop (best-effort, silent failure)
+                subscription._increment_drop_count(DROP_STOPPED)
+            return []
+
+        frame_ns = _as_frame_ns(frame_timestamp)
+        return [
+            subscription for subscription in subscriptions
+            if (subscription._gate or _bind_gate(subscription))(subscription, frame_ns)
+        ]
 
     def record_dispatch(
         self,
         subscription: Subscription,
         frame_id: int,
-        frame_timestamp: datetime
+        frame_timestamp: int
     ) -> None:
         """
         Phase 3.3: Record that a frame was dispatched to a subscription.
@@ -419,11 +882,12 @@ class StreamAgent:
         Args:
             subscription: The subscription that received the frame
             frame_id: The dispatched frame identifier
-            frame_timestamp: The dispatched frame timestamp
+            frame_timestamp: The dispatched frame time as time.monotonic_ns()
+                             integer nanoseconds (datetime is deprecated)
         """
         # Phase 3.4: Defensive guard - STOPPED agents do not update state
         # Fail-closed: silently ignore state updates for stopped agents
-        if self.state == AgentState.STOPPED:
+        if self._state == _STOPPED:
             return
 
         # Phase 3.4: Defensive guard - inactive subscriptions do not update state
@@ -433,11 +897,67 @@ class StreamAgent:
 
         # Update subscription dispatch state
         subscription.last_dispatched_frame_id = frame_id
-        subscription.last_dispatch_timestamp = frame_timestamp
+        if type(frame_timestamp) is not int:
+            frame_timestamp = _as_frame_ns(frame_timestamp)
+        subscription.last_dispatch_ns = frame_timestamp
 
         # Phase 7: Track successful dispatch (best-effort, silent failure)
         subscription._increment_dispatch_count()
 
+    def try_dispatch(
+        self,
+        subscription: Subscription,
+        frame_id: int,
+        frame_timestamp: int
+    ) -> bool:
+        """
+        Phase 3.3: FPS gating decision and dispatch record in one call.
+
+        Equivalent to should_dispatch() followed, on ALLOW, by
+        record_dispatch(), but the STOPPED guard, active check and
+        timestamp normalization run once per frame instead of twice.
+
+        Same semantics as the paired calls:
+        - SKIP decisions increment the drop counter (best-effort)
+        - ALLOW decisions update last_dispatched_frame_id,
+          last_dispatch_ns and the dispatch counter (best-effort)
+        - No frame access, no actual dispatch execution
+
+        Args:
+            subscription: The subscription to evaluate
+            frame_id: Current frame identifier (recorded on ALLOW)
+            frame_timestamp: Current frame time as time.monotonic_ns()
+                             integer nanoseconds (datetime is deprecated)
+
+        Returns:
+            True if the frame should be dispatched (ALLOW, already recorded)
+            False if the frame should be skipped (SKIP)
+        """
+        if self._state != _STOPPED:
+            if type(frame_timestamp) is not int:
+                frame_timestamp = _as_frame_ns(frame_timestamp)
+
+            gate = subscription._gate
+            if gate is None:
+                gate = _bind_gate(subscription)
+
+            # The bound gate only ALLOWs active subscriptions, so the
+            # record_dispatch() guards are already satisfied here
+            if gate(subscription, frame_timestamp):
+                subscription.last_dispatched_frame_id = frame_id
+                subscription.last_dispatch_ns = frame_timestamp
+
+                # Phase 7: Track successful dispatch (best-effort, silent failure)
+                subscription._increment_dispatch_count()
+                return True
+
+            return False
+
+        # Phase 3.4: Defensive guard - STOPPED agents cannot make dispatch decisions
+        # Phase 7: Track drop (best-effort, silent failure)
+        subscription._increment_drop_count(DROP_STOPPED)
+        return False
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Phase 7: Get read-only observability metrics for this StreamAgent.
@@ -457,11 +977,11 @@ class StreamAgent:
         """
         try:
             subscription_metrics = []
-            for model_id, subscription in self._subscriptions.items():
+            for subscription in self._sub_list or ():
                 try:
                     # Get per-subscription metrics (best-effort)
                     sub_metrics = subscription.get_metrics()
-                    sub_metrics["model_id"] = model_id
+                    sub_metrics["model_id"] = subscription.model_id
                     sub_metrics["camera_id"] = self.camera_id
                     sub_metrics["active"] = subscription.active
                     subscription_metrics.append(sub_metrics)
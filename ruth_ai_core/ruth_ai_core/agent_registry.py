@@ -13,10 +13,14 @@ CRITICAL CONSTRAINTS:
 - Thread-safe for concurrent reconciliation
 """
 
-from typing import Dict, Optional
+import sys
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from loguru import logger
 
-from .agent import StreamAgent
+from .agent import StreamAgent, _legacy_frame_timestamp
+from .subscription import Subscription
 from .types import AgentState
 
 
@@ -35,11 +39,20 @@ class AgentRegistry:
     - No network I/O
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("_agents", "_lock", "_snapshot")
+
     def __init__(self):
         """Initialize empty agent registry."""
         # Dict[camera_id, StreamAgent]
         self._agents: Dict[str, StreamAgent] = {}
 
+        # Guards _agents mutations (readers use the snapshot below)
+        self._lock = threading.RLock()
+
+        # Read-only snapshot of _agents, rebuilt lazily after a mutation
+        self._snapshot: Optional[Mapping[str, StreamAgent]] = None
+
     def get_or_create_agent(
         self,
         camera_id: str,
@@ -63,15 +76,23 @@ class AgentRegistry:
         CRITICAL: This does NOT start the agent.
         Caller must call agent.start() if needed.
         """
-        if camera_id in self._agents:
-            return self._agents[camera_id]
+        # Interned: the registry key, StreamAgent.camera_id and the ids
+        # reconciliation passes back on later cycles share one object
+        if type(camera_id) is str:
+            camera_id = sys.intern(camera_id)
 
-        # Create new agent (CREATED state)
-        agent = StreamAgent(camera_id=camera_id, frame_source_path=frame_source_path)
-        self._agents[camera_id] = agent
+        with self._lock:
+            if camera_id in self._agents:
+                return self._agents[camera_id]
 
+            # Create new agent (CREATED state)
+            agent = StreamAgent(camera_id=camera_id, frame_source_path=frame_source_path)
+            self._agents[camera_id] = agent
+            self._snapshot = None
+
+        # Deferred formatting: args are only formatted if a sink accepts INFO
         logger.info(
-            f"Created new StreamAgent for camera {camera_id} (Phase 8.2 registry)"
+            "Created new StreamAgent for camera {} (Phase 8.2 registry)", camera_id
         )
 
         return agent
@@ -88,14 +109,23 @@ class AgentRegistry:
         """
         return self._agents.get(camera_id)
 
-    def list_agents(self) -> Dict[str, StreamAgent]:
+    def list_agents(self) -> Mapping[str, StreamAgent]:
         """
         List all registered StreamAgents.
 
         Returns:
-            Dictionary mapping camera_id -> StreamAgent
+            Read-only mapping camera_id -> StreamAgent. This is a snapshot:
+            it is shared between callers until the next registry mutation
+            and is not affected by later agent creation/removal.
         """
-        return self._agents.copy()
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = MappingProxyType(dict(self._agents))
+                    self._snapshot = snapshot
+        return snapshot
 
     def remove_agent(self, camera_id: str) -> bool:
         """
@@ -112,22 +142,158 @@ class AgentRegistry:
         - Caller must ensure agent is in STOPPED state before removal
         - This is immediate removal (no draining, no cleanup)
         """
-        if camera_id in self._agents:
-            agent = self._agents[camera_id]
+        with self._lock:
+            agent = self._agents.pop(camera_id, None)
+            if agent is None:
+                return False
+            self._snapshot = None
+
+        # Safety check: warn if removing non-stopped agent
+        if agent.state != AgentState.STOPPED:
+            logger.warning(
+                "Removing StreamAgent for camera {} in state {} "
+                "(should be STOPPED, Phase 8.2)",
+                camera_id, agent.state.value
+            )
+
+        logger.info("Removed StreamAgent for camera {} (Phase 8.2)", camera_id)
+        return True
+
+    def bulk_apply(
+        self,
+        plan: Mapping[str, Dict[str, Any]],
+        hashes: Optional[Mapping[str, Dict[str, Optional[int]]]] = None,
+        build_config: Optional[Callable[[Any], Dict[str, Any]]] = None
+    ) -> Dict[str, Union[Tuple[List[str], List[str], List[str]], Exception]]:
+        """
+        Phase 8.2: Apply desired subscriptions to many cameras in one call.
+
+        For each camera in the plan (under a single lock acquisition):
+        - Skip it if its desired set is empty and it has no StreamAgent
+          (nothing to remove; no empty agent is created)
+        - Get or create its StreamAgent
+        - StreamAgent.apply_subscriptions() with its desired configs
+
+        After the lock is released, agents still in CREATED state are
+        started and new agents are logged.
+
+        Args:
+            plan: Dict[camera_id, Dict[model_id, config]]
+                  (Dict[camera_id, Dict[model_id, value]] with build_config)
+            hashes: Optional Dict[camera_id, Dict[model_id, config hash]]
+                    (see StreamAgent.apply_subscriptions)
+            build_config: Optional config builder for the plan values
+                          (see StreamAgent.apply_subscriptions)
+
+        Returns:
+            Dict[camera_id, (added, removed, updated)] model_id lists,
+            or the exception that camera failed with. One camera failing
+            does not affect the others.
+        """
+        results: Dict[str, Union[Tuple[List[str], List[str], List[str]], Exception]] = {}
+        created: List[str] = []
+        to_start: List[StreamAgent] = []
+
+        with self._lock:
+            agents = self._agents
+
+            for camera_id, desired_configs in plan.items():
+                try:
+                    agent = agents.get(camera_id)
+
+                    if agent is None:
+                        if not desired_configs:
+                            results[camera_id] = ([], [], [])
+                            continue
+
+                        # Same as get_or_create_agent(), logged below
+                        if type(camera_id) is str:
+                            camera_id = sys.intern(camera_id)
+                        agent = StreamAgent(camera_id=camera_id)
+                        agents[camera_id] = agent
+                        self._snapshot = None
+                        created.append(camera_id)
+
+                    # Phase 8.2: Agents are started on-demand during reconciliation
+                    if agent.state == AgentState.CREATED:
+                        to_start.append(agent)
+
+                    results[camera_id] = agent.apply_subscriptions(
+                        desired_configs,
+                        hashes.get(camera_id) if hashes is not None else None,
+                        build_config
+                    )
+
+                except Exception as e:
+                    results[camera_id] = e
+
+        for camera_id in created:
+            logger.info(
+                "Created new StreamAgent for camera {} (Phase 8.2 registry)", camera_id
+            )
+
+        for agent in to_start:
+            try:
+                if agent.state == AgentState.CREATED:
+                    agent.start()
+                    logger.info(
+                        "Started StreamAgent for camera {} (Phase 8.2)", agent.camera_id
+                    )
+            except Exception as e:
+                # A concurrent start() winning the race is not a failure
+                if agent.state != AgentState.RUNNING:
+                    results[agent.camera_id] = e
+
+        return results
+
+    def gate_all(
+        self,
+        frame_timestamp: int,
+        legacy_frame_timestamp: Optional[int] = None,
+        *,
+        frame_id: Any = None
+    ) -> List[Tuple[str, Subscription]]:
+        """
+        Phase 3.3: FPS gating decision for every subscription in the fleet.
 
-            # Safety check: warn if removing non-stopped agent
-            if agent.state != AgentState.STOPPED:
-                logger.warning(
-                    f"Removing StreamAgent for camera {camera_id} in state {agent.state.value} "
-                    f"(should be STOPPED, Phase 8.2)"
-                )
+        Equivalent to calling StreamAgent.should_dispatch_batch() on each
+        registered agent for the same scheduler tick, collected into one
+        flat result.
 
-            del self._agents[camera_id]
+        Same semantics as should_dispatch_batch():
+        - Pure decision logic, no dispatch
+        - SKIP decisions increment drop counters (best-effort)
+        - Caller must call record_dispatch() for each dispatched pair
 
-            logger.info(f"Removed StreamAgent for camera {camera_id} (Phase 8.2)")
-            return True
+        Args:
+            frame_timestamp: Current tick time as time.monotonic_ns()
+                             integer nanoseconds
+            legacy_frame_timestamp: Deprecated; only set by old
+                             (frame_id, frame_timestamp) calls, whose
+                             frame_id is ignored
+            frame_id: Deprecated keyword form of the same old call
+                      (frame_id=..., frame_timestamp=...); ignored
 
-        return False
+        Returns:
+            (camera_id, Subscription) pairs that should receive a frame,
+            grouped by agent in registry order
+        """
+        # Deprecated call forms are resolved (and warned about) once,
+        # not once per agent
+        if legacy_frame_timestamp is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_timestamp, legacy_frame_timestamp)
+        elif frame_id is not None:
+            frame_timestamp = _legacy_frame_timestamp(frame_id, frame_timestamp)
+
+        allowed: List[Tuple[str, Subscription]] = []
+        append = allowed.append
+
+        # Iterate the snapshot: safe against concurrent create/remove
+        for camera_id, agent in self.list_agents().items():
+            for subscription in agent.should_dispatch_batch(frame_timestamp):
+                append((camera_id, subscription))
+
+        return allowed
 
     def agent_count(self) -> int:
         """Get total number of registered agents."""
@@ -10,14 +10,24 @@ CRITICAL CONSTRAINTS:
 - Read-only access to backend APIs
 - Best-effort fetching (failures are acceptable)
 - No retries, no backoff
-- No caching (always fetch fresh)
+- No stale data: the last full-list response is reused only when the
+  backend confirms it unchanged (HTTP 304 to a conditional GET)
 - Never blocks reconciliation on failure
 """
 
+import asyncio
+import json
+
 import aiohttp
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # Faster C decoder when installed
+except ImportError:
+    _json_loads = json.loads  # Fallback: stdlib (accepts bytes too)
+
 
 class AssignmentClient:
     """
@@ -31,6 +41,11 @@ class AssignmentClient:
     - API error → return empty list (fail-safe)
     - Invalid response → return empty list (fail-safe)
     - No retries, no blocking
+
+    CONNECTIONS:
+    - One aiohttp session per client, created lazily on first fetch so
+      reconciliation polls reuse pooled keep-alive connections
+    - Call close() on shutdown to release it
     """
 
     def __init__(self, backend_url: str, timeout_seconds: float = 5.0):
@@ -44,10 +59,65 @@ class AssignmentClient:
         self.backend_url = backend_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
 
+        # Shared HTTP session (created lazily inside the running event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Conditional GET state for fetch_all_assignments(): ETag of the
+        # last 200 response and the assignments parsed from it
+        self._etag: Optional[str] = None
+        self._cached_assignments: List[Dict[str, Any]] = []
+
+        # False once the backend answered 404 for the digest endpoint
+        # (older backend): fetch_assignment_digests() stops asking
+        self._digests_supported = True
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        A closed session (e.g. after close()) is replaced transparently.
+        """
+        session = self._session
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            )
+            self._session = session
+        return session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session (best-effort).
+
+        Safe to call more than once; a later fetch opens a new session.
+        """
+        session = self._session
+        self._session = None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(
+                    f"Error closing assignment client session (Phase 8.2): {e}"
+                )
+
     async def fetch_all_assignments(self) -> List[Dict[str, Any]]:
         """
         Fetch all camera-to-model assignments from backend.
 
+        Same as try_fetch_all_assignments(), but returns an empty list on
+        failure (fail-safe).
+
+        CRITICAL: This MUST NOT raise exceptions.
+        """
+        assignments = await self.try_fetch_all_assignments()
+        return [] if assignments is None else assignments
+
+    async def try_fetch_all_assignments(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch all camera-to-model assignments from backend.
+
         Calls: GET /api/v1/ai-model-assignments?enabled=true
 
         Returns:
@@ -61,7 +131,12 @@ class AssignmentClient:
             - parameters: Model-specific config (dict or None)
 
         On failure:
-            Returns empty list (fail-safe)
+            Returns None, so callers can tell "backend unavailable" from
+            "no enabled assignments" (an empty list)
+
+        If the backend sent an ETag, the next call sends If-None-Match and
+        a 304 response returns the previously parsed list (same object;
+        callers must not mutate it) without downloading or parsing a body.
 
         CRITICAL: This MUST NOT raise exceptions.
         All errors must be caught and logged.
@@ -69,49 +144,126 @@ class AssignmentClient:
         try:
             url = f"{self.backend_url}/api/v1/ai-model-assignments"
             params = {"enabled": "true", "limit": 1000}  # Only fetch enabled assignments
+            headers = {"If-None-Match": self._etag} if self._etag else None
+
+            session = await self._get_session()
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status == 304:
+                    # Unchanged since the last 200 response
+                    return self._cached_assignments
+
+                if response.status != 200:
+                    logger.warning(
+                        f"Backend API returned non-200 status: {response.status} "
+                        f"(Phase 8.2 assignment fetch)"
+                    )
+                    return None
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            f"Backend API returned non-200 status: {response.status} "
-                            f"(Phase 8.2 assignment fetch)"
-                        )
-                        return []
+                data = _json_loads(await response.read())
 
-                    data = await response.json()
+                # Extract assignments list from response
+                # Phase 8.1 API returns: {"assignments": [...], "total": N, ...}
+                assignments = data.get("assignments", [])
 
-                    # Extract assignments list from response
-                    # Phase 8.1 API returns: {"assignments": [...], "total": N, ...}
-                    assignments = data.get("assignments", [])
+                if not isinstance(assignments, list):
+                    logger.warning(
+                        "Backend API returned invalid assignments format "
+                        "(expected list, Phase 8.2)"
+                    )
+                    return None
 
-                    if not isinstance(assignments, list):
-                        logger.warning(
-                            "Backend API returned invalid assignments format "
-                            "(expected list, Phase 8.2)"
-                        )
-                        return []
+                logger.info(
+                    f"Fetched {len(assignments)} assignments from backend "
+                    f"(Phase 8.2)"
+                )
 
-                    logger.info(
-                        f"Fetched {len(assignments)} assignments from backend "
-                        f"(Phase 8.2)"
-                    )
+                # Remember for the next conditional GET (no ETag → no cache)
+                self._etag = response.headers.get("ETag")
+                self._cached_assignments = assignments if self._etag else []
 
-                    return assignments
+                return assignments
 
         except aiohttp.ClientError as e:
             # Network error, connection refused, timeout, etc.
             logger.warning(
                 f"Failed to fetch assignments from backend (network error, Phase 8.2): {e}"
             )
-            return []
+            return None
 
         except Exception as e:
             # Unexpected error (JSON parsing, etc.)
             logger.error(
                 f"Unexpected error fetching assignments from backend (Phase 8.2): {e}"
             )
-            return []
+            return None
+
+    async def fetch_assignment_digests(self) -> Optional[Dict[str, str]]:
+        """
+        Fetch per-camera content digests of enabled assignments.
+
+        Calls: GET /api/v1/ai-model-assignments/digests?enabled=true
+
+        Returns:
+            Dictionary mapping camera_id -> digest string. A camera's
+            digest changes whenever its enabled assignments change;
+            cameras without enabled assignments are absent.
+
+        On failure (including backends without the digest endpoint):
+            Returns None, so the caller can fall back to a full fetch.
+            (An empty dict means "no enabled assignments", not failure.)
+            A 404 is remembered: later calls return None without a request.
+
+        CRITICAL: This MUST NOT raise exceptions.
+        All errors must be caught and logged.
+        """
+        if not self._digests_supported:
+            return None
+
+        try:
+            url = f"{self.backend_url}/api/v1/ai-model-assignments/digests"
+            params = {"enabled": "true"}
+
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 404:
+                    logger.info(
+                        "Backend has no assignment digest endpoint, using full "
+                        "fetches (Phase 8.2)"
+                    )
+                    self._digests_supported = False
+                    return None
+
+                if response.status != 200:
+                    logger.warning(
+                        f"Backend API returned non-200 status for assignment digests: "
+                        f"{response.status} (Phase 8.2)"
+                    )
+                    return None
+
+                data = _json_loads(await response.read())
+                digests = data.get("digests")
+
+                if not isinstance(digests, dict):
+                    logger.warning(
+                        "Backend API returned invalid assignment digests format "
+                        "(expected dict, Phase 8.2)"
+                    )
+                    return None
+
+                return digests
+
+        except aiohttp.ClientError as e:
+            logger.warning(
+                f"Failed to fetch assignment digests from backend "
+                f"(network error, Phase 8.2): {e}"
+            )
+            return None
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error fetching assignment digests from backend (Phase 8.2): {e}"
+            )
+            return None
 
     async def fetch_assignments_for_camera(self, camera_id: str) -> List[Dict[str, Any]]:
         """
@@ -135,25 +287,25 @@ class AssignmentClient:
             url = f"{self.backend_url}/api/v1/ai-model-assignments"
             params = {"camera_id": camera_id, "enabled": "true", "limit": 100}
 
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            f"Backend API returned non-200 status for camera {camera_id}: "
-                            f"{response.status} (Phase 8.2)"
-                        )
-                        return []
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.warning(
+                        f"Backend API returned non-200 status for camera {camera_id}: "
+                        f"{response.status} (Phase 8.2)"
+                    )
+                    return []
 
-                    data = await response.json()
-                    assignments = data.get("assignments", [])
+                data = _json_loads(await response.read())
+                assignments = data.get("assignments", [])
 
-                    if not isinstance(assignments, list):
-                        logger.warning(
-                            f"Invalid assignments format for camera {camera_id} (Phase 8.2)"
-                        )
-                        return []
+                if not isinstance(assignments, list):
+                    logger.warning(
+                        f"Invalid assignments format for camera {camera_id} (Phase 8.2)"
+                    )
+                    return []
 
-                    return assignments
+                return assignments
 
         except aiohttp.ClientError as e:
             logger.warning(
@@ -168,3 +320,37 @@ class AssignmentClient:
                 f"(Phase 8.2): {e}"
             )
             return []
+
+    async def fetch_assignments_for_cameras(
+        self,
+        camera_ids: List[str],
+        max_concurrency: int = 16
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch assignments for several cameras concurrently.
+
+        Issues fetch_assignments_for_camera() for each camera over the
+        shared session, with at most max_concurrency requests in flight.
+
+        Args:
+            camera_ids: Camera UUID strings
+            max_concurrency: Maximum concurrent requests (default: 16)
+
+        Returns:
+            Dictionary mapping camera_id -> list of assignment dictionaries.
+            A camera whose fetch failed maps to an empty list (fail-safe).
+
+        CRITICAL: This MUST NOT raise exceptions.
+        Per-camera failures are handled by fetch_assignments_for_camera().
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_one(camera_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.fetch_assignments_for_camera(camera_id)
+
+        results = await asyncio.gather(
+            *(fetch_one(camera_id) for camera_id in camera_ids)
+        )
+
+        return dict(zip(camera_ids, results))
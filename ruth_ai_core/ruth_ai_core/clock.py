@@ -0,0 +1,56 @@
+"""
+Phase 3.3 – FPS Scheduling & Frame Selection
+
+This module defines the time base used for FPS gating.
+
+Dispatch timestamps are integer nanoseconds from time.monotonic_ns().
+Gating only needs elapsed time, so a monotonic integer clock avoids
+datetime/timedelta allocation on the per-frame path and is immune to
+wall-clock adjustments.
+
+Wall-clock datetimes are only produced at the observability boundary
+(get_metrics) and only accepted through a deprecated compatibility path.
+
+CONSTRAINTS:
+- Pure time conversion only
+- No external dependencies
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def now_ns() -> int:
+    """Current monotonic time in integer nanoseconds."""
+    return time.monotonic_ns()
+
+
+def _wall_offset_ns() -> int:
+    """Offset that maps the monotonic clock onto UTC wall-clock time."""
+    return time.time_ns() - time.monotonic_ns()
+
+
+def monotonic_ns_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    """
+    Convert a monotonic nanosecond timestamp to a naive UTC datetime.
+
+    The conversion uses the current wall/monotonic offset, so it is
+    approximate if the wall clock was adjusted in between. Intended for
+    human-facing output only.
+    """
+    if ns is None:
+        return None
+    seconds = (ns + _wall_offset_ns()) / 1_000_000_000
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+
+
+def datetime_to_monotonic_ns(value: datetime) -> int:
+    """
+    Convert a wall-clock datetime to the monotonic nanosecond time base.
+
+    Naive datetimes are interpreted as UTC (datetime.utcnow() convention).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000_000) - _wall_offset_ns()
@@ -20,12 +20,122 @@ CRITICAL CONSTRAINTS:
 - Must converge eventually
 """
 
-from typing import Dict, List, Set, Any, Optional
+import copy
+import json
+from collections import defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, List, Mapping, Set, Any, Optional, Tuple, Union
 from loguru import logger
 
 from .agent import StreamAgent
 from .agent_registry import AgentRegistry
 from .assignment_client import AssignmentClient
+from .subscription import canonical_json, config_hash
+
+
+def _build_subscription_config(assignment: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build StreamAgent subscription config from backend assignment.
+
+    Only called for subscriptions that are added or updated (see
+    StreamAgent.apply_subscriptions build_config), not every cycle.
+
+    Args:
+        assignment: Assignment dict from backend API
+
+    Returns:
+        A new subscription config dict for StreamAgent.add_subscription().
+        parameters is copied: assignments may be reused across cycles
+        (HTTP 304), so the config must not share state with them.
+
+    Phase 8.2 mapping:
+    - assignment.desired_fps → config["desired_fps"]
+    - assignment.priority → config["priority"]
+    - assignment.parameters → config["parameters"]
+    """
+    config: Dict[str, Any] = {}
+
+    # Map desired_fps (Phase 3.3 FPS scheduling)
+    desired_fps = assignment.get("desired_fps")
+    if desired_fps is not None:
+        config["desired_fps"] = desired_fps
+
+    # Map priority (future use)
+    priority = assignment.get("priority")
+    if priority is not None:
+        config["priority"] = priority
+
+    # Map model-specific parameters (opaque passthrough)
+    parameters = assignment.get("parameters")
+    if parameters is not None:
+        config["parameters"] = copy.deepcopy(parameters)
+
+    return config
+
+
+# typed: 5, 5.0 and True are distinct keys (their configs hash differently)
+@lru_cache(maxsize=4096, typed=True)
+def _cached_config_hash(
+    desired_fps: Any,
+    priority: Any,
+    parameters_json: Optional[Union[str, bytes]]
+) -> Optional[int]:
+    """config_hash() of the config for these field values, computed once."""
+    config: Dict[str, Any] = {}
+    if desired_fps is not None:
+        config["desired_fps"] = desired_fps
+    if priority is not None:
+        config["priority"] = priority
+    if parameters_json is not None:
+        # Cache miss only: parameters is keyed by its canonical encoding
+        config["parameters"] = json.loads(parameters_json)
+    return config_hash(config)
+
+
+def _subscription_config_hash(assignment: Dict[str, Any]) -> Optional[int]:
+    """
+    config_hash() of _build_subscription_config(assignment), without
+    building the config. Memoized per distinct field values.
+
+    Returns:
+        The hash, or None if a field cannot be hashed or encoded
+    """
+    parameters = assignment.get("parameters")
+
+    try:
+        return _cached_config_hash(
+            assignment.get("desired_fps"),
+            assignment.get("priority"),
+            None if parameters is None else canonical_json(parameters),
+        )
+
+    except (TypeError, ValueError):
+        return None
+
+
+def _assignments_fingerprint(assignments: List[Dict[str, Any]]) -> Optional[int]:
+    """
+    Content fingerprint of a full assignment list (stable within a process).
+
+    Covers every field reconciliation uses, in list order (the backend
+    returns a stable order; a reordering only costs one full cycle).
+    None if a field cannot be hashed or encoded.
+    """
+    try:
+        entries = []
+        for assignment in assignments:
+            parameters = assignment.get("parameters")
+            entries.append((
+                assignment.get("camera_id"),
+                assignment.get("model_id"),
+                assignment.get("desired_fps"),
+                assignment.get("priority"),
+                None if parameters is None else canonical_json(parameters),
+            ))
+        return hash(tuple(entries))
+
+    except (TypeError, ValueError):
+        return None
 
 
 class ReconciliationEngine:
@@ -36,26 +146,26 @@ class ReconciliationEngine:
 
     RECONCILIATION ALGORITHM:
     1. Fetch desired assignments from backend (Phase 8.1 APIs)
-    2. For each camera with assignments:
-       a. Get or create StreamAgent
-       b. Compare desired vs current subscriptions
-       c. Add missing subscriptions
-       d. Remove obsolete subscriptions
-       e. Update existing subscriptions if config changed
-    3. Handle failures gracefully (partial reconciliation OK)
+    2. Group desired assignments (and config hashes) by camera
+    3. Apply them in one AgentRegistry.bulk_apply() call, which per camera:
+       a. Gets or creates (and starts) the StreamAgent
+       b. Adds missing subscriptions
+       c. Removes obsolete subscriptions
+       d. Updates existing subscriptions if config changed
+    4. Handle failures gracefully (partial reconciliation OK)
 
     FAILURE SEMANTICS:
     - Backend unavailable → skip reconciliation (retry next cycle)
     - Camera not found → log warning, continue with other cameras
-    - Subscription add fails → log error, continue with other subscriptions
-    - Subscription remove fails → log error, continue
+    - Camera apply fails → log error, continue with other cameras
     - Partial reconciliation is acceptable
     """
 
     def __init__(
         self,
         agent_registry: AgentRegistry,
-        assignment_client: AssignmentClient
+        assignment_client: AssignmentClient,
+        concurrency: int = 16
     ):
         """
         Initialize reconciliation engine.
@@ -63,9 +173,23 @@ class ReconciliationEngine:
         Args:
             agent_registry: StreamAgent registry
             assignment_client: Backend assignment API client
+            concurrency: Maximum number of per-camera assignment fetches
+                         in flight at once (default: 16)
         """
         self.agent_registry = agent_registry
         self.assignment_client = assignment_client
+        self.concurrency = concurrency
+
+        # Per-camera assignment digests as of the last successful
+        # reconciliation of each camera (Dict[camera_id, digest])
+        self._last_digests: Dict[str, str] = {}
+
+        # Full-fetch short-circuit state, set only after an error-free
+        # full cycle: the assignment list, its fingerprint and the
+        # registry snapshot it was applied to
+        self._last_assignments: Optional[List[Dict[str, Any]]] = None
+        self._last_fingerprint: Optional[int] = None
+        self._last_agents: Optional[Mapping[str, StreamAgent]] = None
 
     async def reconcile_all(self) -> Dict[str, Any]:
         """
@@ -73,6 +197,12 @@ class ReconciliationEngine:
 
         This is the main reconciliation entry point, called periodically.
 
+        DIGEST-BASED CYCLES:
+        - Per-camera assignment digests are fetched first (cheap)
+        - Once a full cycle has recorded digests, only cameras whose digest
+          changed (or disappeared) are fetched and reconciled
+        - If digests are unavailable, a full fetch is used (original path)
+
         Returns:
             Reconciliation summary with statistics:
             - cameras_processed: Number of cameras reconciled
@@ -80,12 +210,15 @@ class ReconciliationEngine:
             - subscriptions_removed: Number of subscriptions deleted
             - subscriptions_updated: Number of subscriptions modified
             - errors: Number of errors encountered
+            - backend_unavailable: True if assignments could not be
+              fetched, so nothing was reconciled
 
         CRITICAL:
         - This MUST NOT raise exceptions
         - All errors must be caught and logged
         - Partial reconciliation is acceptable
-        - Missing backend is acceptable (returns empty stats)
+        - Missing backend is acceptable (returns empty stats with
+          backend_unavailable set)
         """
         try:
             # Initialize statistics
@@ -95,60 +228,20 @@ class ReconciliationEngine:
                 "subscriptions_removed": 0,
                 "subscriptions_updated": 0,
                 "errors": 0,
+                "backend_unavailable": False,
             }
 
-            # Fetch desired assignments from backend
             logger.info("Starting reconciliation cycle (Phase 8.2)")
-            desired_assignments = await self.assignment_client.fetch_all_assignments()
-
-            if not desired_assignments:
-                logger.info(
-                    "No enabled assignments from backend, reconciliation complete "
-                    "(Phase 8.2)"
-                )
-                return stats
-
-            # Group assignments by camera_id
-            # Dict[camera_id, List[assignment]]
-            assignments_by_camera: Dict[str, List[Dict[str, Any]]] = {}
-
-            for assignment in desired_assignments:
-                camera_id = assignment.get("camera_id")
-                if not camera_id:
-                    logger.warning(
-                        f"Assignment missing camera_id, skipping (Phase 8.2): {assignment}"
-                    )
-                    stats["errors"] += 1
-                    continue
-
-                # Convert UUID to string if needed
-                camera_id_str = str(camera_id)
 
-                if camera_id_str not in assignments_by_camera:
-                    assignments_by_camera[camera_id_str] = []
+            # Cheap change detection first (None = unavailable)
+            digests = await self.assignment_client.fetch_assignment_digests()
 
-                assignments_by_camera[camera_id_str].append(assignment)
-
-            # Reconcile each camera
-            for camera_id, camera_assignments in assignments_by_camera.items():
-                try:
-                    camera_stats = await self._reconcile_camera(
-                        camera_id, camera_assignments
-                    )
-
-                    # Aggregate statistics
-                    stats["cameras_processed"] += 1
-                    stats["subscriptions_added"] += camera_stats.get("added", 0)
-                    stats["subscriptions_removed"] += camera_stats.get("removed", 0)
-                    stats["subscriptions_updated"] += camera_stats.get("updated", 0)
-                    stats["errors"] += camera_stats.get("errors", 0)
-
-                except Exception as e:
-                    # Camera reconciliation failed entirely
-                    logger.error(
-                        f"Failed to reconcile camera {camera_id} (Phase 8.2): {e}"
-                    )
-                    stats["errors"] += 1
+            if digests is not None and self._last_digests:
+                await self._reconcile_changed_cameras(digests, stats)
+            else:
+                if not await self._reconcile_full(digests, stats):
+                    stats["backend_unavailable"] = True
+                    return stats
 
             logger.info(
                 f"Reconciliation cycle complete (Phase 8.2): "
@@ -170,201 +263,311 @@ class ReconciliationEngine:
                 "subscriptions_removed": 0,
                 "subscriptions_updated": 0,
                 "errors": 1,
+                "backend_unavailable": False,
             }
 
-    async def _reconcile_camera(
+    async def _reconcile_full(
         self,
-        camera_id: str,
-        desired_assignments: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        digests: Optional[Dict[str, str]],
+        stats: Dict[str, Any]
+    ) -> bool:
         """
-        Reconcile subscriptions for a single camera.
+        Reconcile every camera from a full assignment fetch.
 
         Args:
-            camera_id: Camera UUID string
-            desired_assignments: List of desired assignments for this camera
+            digests: Digests fetched at the start of this cycle (or None).
+                     Recorded for cameras reconciled without errors, so the
+                     next cycle can skip unchanged cameras.
+            stats: Cycle statistics (updated in place)
 
         Returns:
-            Statistics dictionary:
-            - added: Number of subscriptions created
-            - removed: Number of subscriptions deleted
-            - updated: Number of subscriptions modified
-            - errors: Number of errors
+            False if the backend was unavailable, True otherwise
 
-        CRITICAL: This MUST NOT raise exceptions.
-        All errors must be caught and logged.
-        """
-        stats = {"added": 0, "removed": 0, "updated": 0, "errors": 0}
+        Registered cameras still holding subscriptions but without enabled
+        assignments are reconciled against an empty desired set.
 
-        try:
-            # Get or create StreamAgent for this camera
-            agent = self.agent_registry.get_or_create_agent(camera_id)
-
-            # Start agent if not already running
-            # Phase 8.2: Agents are started on-demand during reconciliation
-            if agent.state.value == "CREATED":
-                try:
-                    agent.start()
-                    logger.info(f"Started StreamAgent for camera {camera_id} (Phase 8.2)")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to start StreamAgent for camera {camera_id} (Phase 8.2): {e}"
-                    )
-                    stats["errors"] += 1
-                    return stats
-
-            # Get current subscriptions
-            current_subscriptions = agent.list_subscriptions()
-            current_model_ids = {sub.model_id for sub in current_subscriptions}
+        If the assignments are identical to the last error-free full cycle
+        and no agent was created or removed (and no digest cycle changed
+        any camera) since, nothing is reconciled.
+        """
+        # Without digests for this cycle, nothing recorded can be trusted
+        self._last_digests = {}
 
-            # Get desired model IDs
-            desired_model_ids = set()
-            desired_configs: Dict[str, Dict[str, Any]] = {}
+        # Fetch desired assignments from backend (None = unavailable)
+        desired_assignments = await self.assignment_client.try_fetch_all_assignments()
 
-            for assignment in desired_assignments:
-                model_id = assignment.get("model_id")
-                if not model_id:
-                    logger.warning(
-                        f"Assignment missing model_id for camera {camera_id}, skipping (Phase 8.2)"
-                    )
-                    stats["errors"] += 1
-                    continue
+        if desired_assignments is None:
+            logger.info(
+                "Backend assignments unavailable, skipping reconciliation "
+                "(Phase 8.2)"
+            )
+            return False
+
+        # Unchanged since the last error-free full cycle? (The client
+        # returns the same list object when the backend answers 304.)
+        fingerprint = None
+        if desired_assignments is not self._last_assignments:
+            fingerprint = _assignments_fingerprint(desired_assignments)
+
+        if (
+            self._last_agents is not None
+            and self._last_agents is self.agent_registry.list_agents()
+            and (
+                desired_assignments is self._last_assignments
+                or (fingerprint is not None and fingerprint == self._last_fingerprint)
+            )
+        ):
+            logger.debug("Assignments unchanged since last cycle, skipping (Phase 8.2)")
+            if digests is not None:
+                # Everything was reconciled without errors last time
+                self._last_digests = dict(digests)
+            return True
+
+        self._last_assignments = None
+        self._last_fingerprint = None
+        self._last_agents = None
+        errors_before = stats["errors"]
+
+        # Group assignments by camera_id
+        # Dict[camera_id, List[assignment]]
+        assignments_by_camera: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        for assignment in desired_assignments:
+            camera_id = assignment.get("camera_id")
+            if not camera_id:
+                logger.warning(
+                    f"Assignment missing camera_id, skipping (Phase 8.2): {assignment}"
+                )
+                stats["errors"] += 1
+                continue
 
-                desired_model_ids.add(model_id)
+            # Convert UUID to string if needed (JSON ids already are)
+            if type(camera_id) is not str:
+                camera_id = str(camera_id)
 
-                # Build subscription config from assignment
-                config = self._build_subscription_config(assignment)
-                desired_configs[model_id] = config
+            assignments_by_camera[camera_id].append(assignment)
 
-            # Determine reconciliation actions
-            models_to_add = desired_model_ids - current_model_ids
-            models_to_remove = current_model_ids - desired_model_ids
-            models_to_check_update = desired_model_ids & current_model_ids
+        # Registered cameras that no longer have enabled assignments
+        for camera_id, agent in self.agent_registry.list_agents().items():
+            if camera_id not in assignments_by_camera and agent.subscription_count:
+                assignments_by_camera[camera_id] = []
 
-            # Add missing subscriptions
-            for model_id in models_to_add:
-                try:
-                    config = desired_configs.get(model_id, {})
-                    agent.add_subscription(model_id, config)
+        # Reconcile all cameras in one registry call
+        for camera_id in self._reconcile_cameras(assignments_by_camera, stats):
+            if digests is not None and camera_id in digests:
+                self._last_digests[camera_id] = digests[camera_id]
 
-                    logger.info(
-                        f"Added subscription: camera={camera_id} model={model_id} "
-                        f"config={config} (Phase 8.2)"
-                    )
-                    stats["added"] += 1
+        if stats["errors"] == errors_before:
+            if fingerprint is None:
+                fingerprint = _assignments_fingerprint(desired_assignments)
+            self._last_assignments = desired_assignments
+            self._last_fingerprint = fingerprint
+            self._last_agents = self.agent_registry.list_agents()
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to add subscription: camera={camera_id} model={model_id} "
-                        f"(Phase 8.2): {e}"
-                    )
-                    stats["errors"] += 1
+        return True
 
-            # Remove obsolete subscriptions
-            for model_id in models_to_remove:
-                try:
-                    agent.remove_subscription(model_id)
+    async def _reconcile_changed_cameras(
+        self,
+        digests: Dict[str, str],
+        stats: Dict[str, Any]
+    ) -> None:
+        """
+        Reconcile only cameras whose assignment digest changed.
 
-                    logger.info(
-                        f"Removed subscription: camera={camera_id} model={model_id} "
-                        f"(Phase 8.2)"
-                    )
-                    stats["removed"] += 1
+        Args:
+            digests: Current per-camera digests from the backend
+            stats: Cycle statistics (updated in place)
+
+        Registered cameras without a digest no longer have enabled
+        assignments; those still holding subscriptions are reconciled
+        against an empty desired set (including cameras whose digest was
+        never recorded, e.g. dropped during a failed cycle).
+        A camera's digest is only recorded after it reconciled without
+        errors, so failures are retried on the next cycle.
+        """
+        last_digests = self._last_digests
+
+        for camera_id in [c for c in last_digests if c not in digests]:
+            del last_digests[camera_id]
+
+        changed = [
+            camera_id for camera_id, digest in digests.items()
+            if last_digests.get(camera_id) != digest
+        ]
+        removed = [
+            camera_id for camera_id, agent in self.agent_registry.list_agents().items()
+            if camera_id not in digests and agent.subscription_count
+        ]
+
+        if not changed and not removed:
+            logger.debug("No assignment changes since last cycle (Phase 8.2)")
+            return
+
+        # Agents are about to diverge from the last full cycle's
+        # assignments: its unchanged shortcut no longer applies
+        self._last_assignments = None
+        self._last_fingerprint = None
+        self._last_agents = None
+
+        # Cameras that lost all enabled assignments
+        assignments_by_camera: Dict[str, List[Dict[str, Any]]] = {
+            camera_id: [] for camera_id in removed
+        }
+
+        if changed:
+            # Changed cameras are fetched concurrently (bounded)
+            fetched = await self.assignment_client.fetch_assignments_for_cameras(
+                changed, max_concurrency=self.concurrency
+            )
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to remove subscription: camera={camera_id} model={model_id} "
-                        f"(Phase 8.2): {e}"
-                    )
-                    stats["errors"] += 1
+            for camera_id in changed:
+                camera_assignments = fetched.get(camera_id)
 
-            # Update existing subscriptions if config changed
-            for model_id in models_to_check_update:
-                try:
-                    subscription = agent.get_subscription(model_id)
-                    if subscription is None:
-                        continue
-
-                    desired_config = desired_configs.get(model_id, {})
-                    current_config = subscription.config
-
-                    # Check if config changed
-                    if self._config_changed(current_config, desired_config):
-                        # Phase 8.2: Config update requires remove + add
-                        # Subscription.config is not mutable after creation
-                        agent.remove_subscription(model_id)
-                        agent.add_subscription(model_id, desired_config)
-
-                        logger.info(
-                            f"Updated subscription: camera={camera_id} model={model_id} "
-                            f"old_config={current_config} new_config={desired_config} (Phase 8.2)"
-                        )
-                        stats["updated"] += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to update subscription: camera={camera_id} model={model_id} "
-                        f"(Phase 8.2): {e}"
+                # A listed digest means the camera has enabled assignments;
+                # an empty result is a failed fetch, not "remove everything"
+                if not camera_assignments:
+                    logger.warning(
+                        f"No assignments fetched for changed camera {camera_id}, "
+                        f"retrying next cycle (Phase 8.2)"
                     )
                     stats["errors"] += 1
+                    continue
 
-            return stats
+                assignments_by_camera[camera_id] = camera_assignments
 
-        except Exception as e:
-            logger.error(
-                f"Unexpected error reconciling camera {camera_id} (Phase 8.2): {e}"
-            )
-            stats["errors"] += 1
-            return stats
+        for camera_id in self._reconcile_cameras(assignments_by_camera, stats):
+            if camera_id in digests:
+                last_digests[camera_id] = digests[camera_id]
 
-    def _build_subscription_config(self, assignment: Dict[str, Any]) -> Dict[str, Any]:
+    def _reconcile_cameras(
+        self,
+        assignments_by_camera: Dict[str, List[Dict[str, Any]]],
+        stats: Dict[str, Any]
+    ) -> List[str]:
         """
-        Build StreamAgent subscription config from backend assignment.
+        Reconcile subscriptions for a set of cameras.
+
+        Desired assignments (and config hashes) are collected for every
+        camera first, then applied through one AgentRegistry.bulk_apply()
+        call (get/create, start and add/remove/update per camera, under a
+        single registry lock). Configs are only built for subscriptions
+        that are added or updated.
 
         Args:
-            assignment: Assignment dict from backend API
+            assignments_by_camera: Dict[camera_id, List[assignment]]
+            stats: Cycle statistics (updated in place)
 
         Returns:
-            Subscription config dict for StreamAgent.add_subscription()
+            camera_ids that reconciled without errors
 
-        Phase 8.2 mapping:
-        - assignment.desired_fps → config["desired_fps"]
-        - assignment.priority → config["priority"]
-        - assignment.parameters → config["parameters"]
+        CRITICAL: This MUST NOT raise exceptions.
+        All errors must be caught and logged.
         """
-        config: Dict[str, Any] = {}
+        clean: List[str] = []
 
-        # Map desired_fps (Phase 3.3 FPS scheduling)
-        if assignment.get("desired_fps") is not None:
-            config["desired_fps"] = assignment["desired_fps"]
+        try:
+            # Dict[camera_id, Dict[model_id, assignment]]
+            plan: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            # Dict[camera_id, Dict[model_id, config hash]]
+            plan_hashes: Dict[str, Dict[str, Optional[int]]] = {}
+            # Dict[camera_id, error count] from building the plan
+            plan_errors: Dict[str, int] = {}
 
-        # Map priority (future use)
-        if assignment.get("priority") is not None:
-            config["priority"] = assignment["priority"]
+            for camera_id, camera_assignments in assignments_by_camera.items():
+                (
+                    plan[camera_id],
+                    plan_hashes[camera_id],
+                    plan_errors[camera_id],
+                ) = self._build_desired_assignments(camera_id, camera_assignments)
+
+            results = self.agent_registry.bulk_apply(
+                plan, plan_hashes, build_config=_build_subscription_config
+            )
 
-        # Map model-specific parameters (opaque passthrough)
-        if assignment.get("parameters") is not None:
-            config["parameters"] = assignment["parameters"]
+        except Exception as e:
+            logger.error(f"Unexpected error applying reconciliation plan (Phase 8.2): {e}")
+            stats["errors"] += 1
+            return clean
+
+        for camera_id in plan:
+            errors = plan_errors[camera_id]
+            result = results.get(camera_id)
+
+            if isinstance(result, Exception) or result is None:
+                # Camera reconciliation failed (changes before the failure are kept)
+                logger.error(
+                    f"Failed to reconcile camera {camera_id} (Phase 8.2): {result}"
+                )
+                stats["errors"] += errors + 1
+                continue
+
+            added, removed, updated = result
+
+            if added or removed or updated:
+                # One record per camera; deferred formatting and structured
+                # fields (args are only formatted if a sink accepts INFO)
+                logger.bind(
+                    camera_id=camera_id, added=added, removed=removed, updated=updated
+                ).info(
+                    "Reconciled camera {}: added={} removed={} updated={} (Phase 8.2)",
+                    camera_id, added, removed, updated
+                )
 
-        return config
+                if added or updated:
+                    # Configs only collected if a sink accepts DEBUG
+                    logger.opt(lazy=True).debug(
+                        "New subscription configs for camera {}: {} (Phase 8.2)",
+                        lambda: camera_id,
+                        lambda: {
+                            s.model_id: s.config
+                            for s in self.agent_registry.get_agent(camera_id).list_subscriptions()
+                            if s.model_id in added or s.model_id in updated
+                        },
+                    )
 
-    def _config_changed(
+            # Aggregate statistics
+            stats["cameras_processed"] += 1
+            stats["subscriptions_added"] += len(added)
+            stats["subscriptions_removed"] += len(removed)
+            stats["subscriptions_updated"] += len(updated)
+            stats["errors"] += errors
+
+            if not errors:
+                clean.append(camera_id)
+
+        return clean
+
+    def _build_desired_assignments(
         self,
-        current_config: Dict[str, Any],
-        desired_config: Dict[str, Any]
-    ) -> bool:
+        camera_id: str,
+        desired_assignments: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Optional[int]], int]:
         """
-        Check if subscription config has changed.
+        Collect the desired assignments of a single camera by model.
 
         Args:
-            current_config: Current subscription config
-            desired_config: Desired subscription config
+            camera_id: Camera UUID string
+            desired_assignments: List of desired assignments for this camera
 
         Returns:
-            True if configs differ, False otherwise
-
-        Phase 8.2: Simple dict equality check.
-        This may produce false positives (e.g., dict ordering),
-        but that's acceptable for best-effort reconciliation.
+            (Dict[model_id, assignment], Dict[model_id, config hash],
+             number of assignments skipped as invalid)
         """
-        return current_config != desired_config
+        assignments_by_model: Dict[str, Dict[str, Any]] = {}
+        desired_hashes: Dict[str, Optional[int]] = {}
+        errors = 0
+
+        for assignment in desired_assignments:
+            model_id = assignment.get("model_id")
+            if not model_id:
+                logger.warning(
+                    f"Assignment missing model_id for camera {camera_id}, skipping (Phase 8.2)"
+                )
+                errors += 1
+                continue
+
+            # Config hash only; the config itself is built on add/update
+            assignments_by_model[model_id] = assignment
+            desired_hashes[model_id] = _subscription_config_hash(assignment)
+
+        return assignments_by_model, desired_hashes, errors
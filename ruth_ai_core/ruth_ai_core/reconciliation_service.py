@@ -14,7 +14,7 @@ EXECUTION MODEL:
 """
 
 import asyncio
-from typing import Optional
+from typing import Any, Dict, Optional
 from loguru import logger
 
 from .reconciliation import ReconciliationEngine
@@ -42,7 +42,8 @@ class ReconciliationService:
     def __init__(
         self,
         reconciliation_engine: ReconciliationEngine,
-        interval_seconds: float = 30.0
+        interval_seconds: float = 30.0,
+        max_interval_seconds: float = 300.0
     ):
         """
         Initialize reconciliation service.
@@ -50,15 +51,24 @@ class ReconciliationService:
         Args:
             reconciliation_engine: Reconciliation engine instance
             interval_seconds: Reconciliation interval in seconds (default: 30.0)
+            max_interval_seconds: Upper bound for the idle backoff interval
+                                  in seconds (default: 300.0)
         """
         self.reconciliation_engine = reconciliation_engine
         self.interval_seconds = interval_seconds
+        self.max_interval_seconds = max(max_interval_seconds, interval_seconds)
 
         # Service state
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
 
+        # Adaptive polling: consecutive cycles that changed nothing
+        self._idle_cycles = 0
+
+        # Set by trigger() and stop() to end the current wait early
+        self._wake = asyncio.Event()
+
     def start(self) -> None:
         """
         Start the periodic reconciliation loop.
@@ -78,7 +88,9 @@ class ReconciliationService:
         )
 
         self._running = True
+        self._idle_cycles = 0
         self._stop_event.clear()
+        self._wake.clear()
         self._task = asyncio.create_task(self._reconciliation_loop())
 
     def stop(self) -> None:
@@ -97,6 +109,18 @@ class ReconciliationService:
         logger.info("Stopping ReconciliationService (Phase 8.2)")
         self._running = False
         self._stop_event.set()
+        self._wake.set()
+
+    def trigger(self) -> None:
+        """
+        Request a reconciliation cycle now.
+
+        Ends the current wait early and resets the polling interval to
+        interval_seconds. Safe to call at any time; has no effect if the
+        service is not running.
+        """
+        self._idle_cycles = 0
+        self._wake.set()
 
     async def wait_stopped(self) -> None:
         """
@@ -123,6 +147,13 @@ class ReconciliationService:
 
         Runs periodically until stopped.
 
+        ADAPTIVE POLLING:
+        - Each consecutive cycle that changed nothing (no adds, removes,
+          updates or errors) doubles the wait, up to max_interval_seconds
+        - Any change or error, or an unavailable backend, resets the wait
+          to interval_seconds (an outage must not slow down recovery)
+        - trigger() runs the next cycle immediately
+
         CRITICAL:
         - This MUST NOT crash on errors
         - Each iteration is independent (stateless)
@@ -130,8 +161,13 @@ class ReconciliationService:
         """
         logger.info("ReconciliationService loop started (Phase 8.2)")
 
+        loop = asyncio.get_running_loop()
+
         try:
             while self._running:
+                # Cleared before the cycle: a trigger() during it is kept
+                self._wake.clear()
+
                 try:
                     # Run reconciliation cycle
                     stats = await self.reconciliation_engine.reconcile_all()
@@ -140,25 +176,31 @@ class ReconciliationService:
                         f"Reconciliation cycle stats (Phase 8.2): {stats}"
                     )
 
+                    if self._is_idle_cycle(stats):
+                        self._idle_cycles += 1
+                    else:
+                        self._idle_cycles = 0
+
                 except Exception as e:
                     # Reconciliation failed, but loop must continue
                     logger.error(
                         f"Reconciliation cycle failed (Phase 8.2), will retry: {e}"
                     )
+                    self._idle_cycles = 0
 
-                # Wait for next cycle or stop signal
+                # Wait for next cycle, trigger() or stop signal.
+                # The interval timer sets the same wake event, so the wait
+                # needs no waiter task and raises no TimeoutError.
+                timer = loop.call_later(self._next_interval(), self._wake.set)
                 try:
-                    await asyncio.wait_for(
-                        self._stop_event.wait(),
-                        timeout=self.interval_seconds
-                    )
+                    await self._wake.wait()
+                finally:
+                    timer.cancel()
+
+                if self._stop_event.is_set():
                     # Stop event was set, exit loop
                     break
 
-                except asyncio.TimeoutError:
-                    # Timeout reached, continue to next cycle
-                    pass
-
         except asyncio.CancelledError:
             logger.info("ReconciliationService loop cancelled (Phase 8.2)")
             raise
@@ -173,6 +215,30 @@ class ReconciliationService:
             self._running = False
             logger.info("ReconciliationService loop exited (Phase 8.2)")
 
+    @staticmethod
+    def _is_idle_cycle(stats: Dict[str, Any]) -> bool:
+        """
+        True if a reconciliation cycle changed nothing and had no errors.
+
+        A cycle that could not reach the backend is never idle.
+        """
+        return not (
+            stats.get("backend_unavailable", False)
+            or stats.get("subscriptions_added", 0)
+            or stats.get("subscriptions_removed", 0)
+            or stats.get("subscriptions_updated", 0)
+            or stats.get("errors", 0)
+        )
+
+    def _next_interval(self) -> float:
+        """Wait before the next cycle: doubles per idle cycle, capped."""
+        if self._idle_cycles == 0:
+            return self.interval_seconds
+
+        # Exponent bounded so the float never overflows on long idle runs
+        backoff = self.interval_seconds * (2 ** min(self._idle_cycles, 32))
+        return min(backoff, self.max_interval_seconds)
+
     @property
     def is_running(self) -> bool:
         """Check if the service is currently running."""
@@ -22,12 +22,66 @@ WHAT THIS IS NOT:
 - Not processing frames
 """
 
+import json
+import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 
+from .clock import monotonic_ns_to_datetime, now_ns
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Phase 7: Number of recent dispatch timestamps kept for the rolling FPS
+_FPS_WINDOW = 100
+
+# Phase 7: Drop reasons (index into Subscription._drop_counts)
+DROP_STOPPED = 0      # StreamAgent is STOPPED
+DROP_INACTIVE = 1     # Subscription is inactive
+DROP_INVALID_FPS = 2  # desired_fps is invalid (fail-closed)
+DROP_FPS_GATE = 3     # Skipped to honor desired_fps
+
+# Metric names, by drop reason index
+_DROP_REASON_NAMES = ("stopped", "inactive", "invalid_fps", "fps_gate")
+
+
+def canonical_json(value: Any) -> Union[str, bytes]:
+    """
+    Canonical (key-sorted) JSON encoding of value.
+
+    Equal values encode equal regardless of dict key order. The result
+    is only meant to be hashed, compared or decoded again within this
+    process: bytes from orjson when installed (faster C encoder), str
+    from the stdlib otherwise.
+
+    Raises:
+        TypeError/ValueError: If value is not JSON-encodable
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True)
+
+
+def config_hash(config: Dict[str, Any]) -> Optional[int]:
+    """
+    Content hash of a subscription config (stable within a process).
+
+    Hash of canonical_json(config), so equal configs hash equal
+    regardless of key order. None if the config cannot be encoded
+    (callers then fall back to comparing the dicts).
+    """
+    try:
+        return hash(canonical_json(config))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True, eq=False)
 class Subscription:
     """
     Represents one AI model's subscription to a camera stream.
@@ -48,6 +102,10 @@ class Subscription:
     - Enforce FPS limits (Phase 3.3)
     - Dispatch frames to models (Phase 3.4)
     - Collect inference results (Phase 3.5)
+
+    Slotted (no per-instance __dict__): one instance exists per
+    (camera, model) pair. eq=False: equality and hashing are the
+    explicit model_id-based __eq__/__hash__ below.
     """
 
     # Subscription identity
@@ -59,12 +117,15 @@ class Subscription:
     config: Dict[str, Any] = field(default_factory=dict)
 
     # Lifecycle metadata (inert for Phase 3.2)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Monotonic integer nanoseconds (see clock.py); the datetime is only
+    # materialized by the created_at property
+    created_ns: int = field(default_factory=now_ns)
 
     # Scheduling state placeholders (inert for Phase 3.2)
     # Phase 3.3 will populate these fields
+    # last_dispatch_ns is monotonic integer nanoseconds (see clock.py)
     last_dispatched_frame_id: Optional[int] = None
-    last_dispatch_timestamp: Optional[datetime] = None
+    last_dispatch_ns: Optional[int] = None
 
     # Subscription status (active by default)
     active: bool = True
@@ -75,6 +136,34 @@ class Subscription:
     # All metric updates must be wrapped in try/except and silently fail.
     _dispatch_count: int = field(default=0, init=False, repr=False)
     _drop_count: int = field(default=0, init=False, repr=False)
+    # Per-reason breakdown of _drop_count, indexed by DROP_* constants
+    _drop_counts: List[int] = field(
+        default_factory=lambda: [0] * len(_DROP_REASON_NAMES), init=False, repr=False
+    )
+
+    # Phase 7: Recent dispatch times (monotonic ns) for the rolling FPS.
+    # Bounded ring buffer: O(1) append, fixed memory per subscription.
+    _recent_dispatch_ns: Deque[int] = field(
+        default_factory=lambda: deque(maxlen=_FPS_WINDOW), init=False, repr=False
+    )
+
+    # Phase 3.3: FPS gate derived from config["desired_fps"] once at creation.
+    # None = no limit, math.inf = invalid desired_fps (fail-closed),
+    # otherwise the minimum interval between dispatches in nanoseconds.
+    # config is not mutated after creation (reconciliation replaces the
+    # subscription on config change), so this never goes stale.
+    _min_interval_ns: Optional[float] = field(default=None, init=False, repr=False)
+
+    # Phase 8.2: config_hash(config), computed once at creation so
+    # reconciliation compares ints instead of (nested) config dicts
+    _config_hash: Optional[int] = field(default=None, init=False, repr=False)
+
+    # Phase 3.3: FPS gate function for this config, bound by StreamAgent
+    # at creation (or on first gating call if constructed directly):
+    # gate(subscription, frame_ns) -> bool
+    _gate: Optional[Callable[["Subscription", int], bool]] = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self):
         """Validate subscription on creation."""
@@ -84,6 +173,39 @@ class Subscription:
         if not isinstance(self.config, dict):
             raise ValueError("config must be a dictionary")
 
+        self._min_interval_ns = self._compute_min_interval_ns(self.config)
+        self._config_hash = config_hash(self.config)
+
+    @staticmethod
+    def _compute_min_interval_ns(config: Dict[str, Any]) -> Optional[float]:
+        """
+        Phase 3.3: Derive the FPS gate interval from config.
+
+        Returns:
+            None if desired_fps is not configured (unlimited)
+            math.inf if desired_fps is invalid (fail-closed)
+            1e9 / desired_fps otherwise
+        """
+        desired_fps = config.get("desired_fps")
+
+        if desired_fps is None:
+            return None
+
+        if not isinstance(desired_fps, (int, float)) or desired_fps <= 0:
+            return math.inf
+
+        return 1_000_000_000 / desired_fps
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a naive UTC datetime (derived from created_ns)."""
+        return monotonic_ns_to_datetime(self.created_ns)
+
+    @property
+    def last_dispatch_timestamp(self) -> Optional[datetime]:
+        """Last dispatch time as a naive UTC datetime, or None (derived from last_dispatch_ns)."""
+        return monotonic_ns_to_datetime(self.last_dispatch_ns)
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
@@ -110,29 +232,36 @@ class Subscription:
         Phase 7: Increment dispatch counter (best-effort, non-blocking).
 
         This is called by StreamAgent.record_dispatch() after a successful
-        dispatch decision.
+        dispatch decision, once last_dispatch_ns is updated; that time is
+        also appended to the rolling-FPS window.
 
         CRITICAL: This MUST NOT raise exceptions or affect dispatch logic.
         All errors must be silently ignored.
         """
         try:
             self._dispatch_count += 1
+            if self.last_dispatch_ns is not None:
+                self._recent_dispatch_ns.append(self.last_dispatch_ns)
         except Exception:
             # Phase 7: Silent failure - metrics errors must not propagate
             pass
 
-    def _increment_drop_count(self) -> None:
+    def _increment_drop_count(self, reason: int) -> None:
         """
         Phase 7: Increment drop counter (best-effort, non-blocking).
 
         This is called by StreamAgent when should_dispatch() returns False
         (frame skipped).
 
+        Args:
+            reason: Why the frame was skipped (one of the DROP_* constants)
+
         CRITICAL: This MUST NOT raise exceptions or affect dispatch logic.
         All errors must be silently ignored.
         """
         try:
             self._drop_count += 1
+            self._drop_counts[reason] += 1
         except Exception:
             # Phase 7: Silent failure - metrics errors must not propagate
             pass
@@ -145,8 +274,12 @@ class Subscription:
             Dictionary containing:
             - dispatch_count: Total frames dispatched
             - drop_count: Total frames dropped (skipped)
+            - drops_by_reason: drop_count broken down by reason
+              (stopped, inactive, invalid_fps, fps_gate)
             - last_dispatch_time: Timestamp of last successful dispatch (or None)
             - last_dispatched_frame_id: Frame ID of last dispatch (or None)
+            - dispatch_fps: Rolling dispatch rate over the last
+              _FPS_WINDOW dispatches (or None if fewer than two)
 
         CRITICAL: This is read-only and best-effort.
         Missing or stale metrics are acceptable.
@@ -156,14 +289,39 @@ class Subscription:
             return {
                 "dispatch_count": self._dispatch_count,
                 "drop_count": self._drop_count,
-                "last_dispatch_time": self.last_dispatch_timestamp.isoformat() if self.last_dispatch_timestamp else None,
+                "drops_by_reason": dict(zip(_DROP_REASON_NAMES, self._drop_counts)),
+                "last_dispatch_time": (
+                    monotonic_ns_to_datetime(self.last_dispatch_ns).isoformat()
+                    if self.last_dispatch_ns is not None else None
+                ),
                 "last_dispatched_frame_id": self.last_dispatched_frame_id,
+                "dispatch_fps": self._rolling_fps(),
             }
         except Exception:
             # Phase 7: Silent failure - return empty metrics on error
             return {
                 "dispatch_count": 0,
                 "drop_count": 0,
+                "drops_by_reason": dict.fromkeys(_DROP_REASON_NAMES, 0),
                 "last_dispatch_time": None,
                 "last_dispatched_frame_id": None,
+                "dispatch_fps": None,
             }
+
+    def _rolling_fps(self) -> Optional[float]:
+        """
+        Phase 7: Dispatch rate over the recent-dispatch window.
+
+        Returns:
+            Dispatches per second, or None if the window holds fewer
+            than two dispatches (or no time has elapsed)
+        """
+        recent = self._recent_dispatch_ns
+        if len(recent) < 2:
+            return None
+
+        span_ns = recent[-1] - recent[0]
+        if span_ns <= 0:
+            return None
+
+        return (len(recent) - 1) * 1_000_000_000 / span_ns
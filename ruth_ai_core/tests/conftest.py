@@ -0,0 +1,8 @@
+"""
+Pytest configuration for Ruth AI Core.
+"""
+import os
+import sys
+
+# Make the ruth_ai_core package importable without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
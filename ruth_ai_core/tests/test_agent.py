@@ -0,0 +1,278 @@
+"""
+StreamAgent Tests
+
+Tests for:
+- Subscription storage (add/remove)
+- FPS gating (should_dispatch, should_dispatch_batch, try_dispatch)
+- Subscription reconciliation (apply_subscriptions)
+- Observability metrics (get_metrics)
+- Deprecated gating call forms
+"""
+import pytest
+
+from ruth_ai_core.agent import StreamAgent
+from ruth_ai_core.subscription import Subscription, config_hash
+from ruth_ai_core.types import AgentState
+
+
+def _apply(agent, desired_configs):
+    """Apply desired configs with their hashes, as reconciliation does."""
+    hashes = {model_id: config_hash(config) for model_id, config in desired_configs.items()}
+    return agent.apply_subscriptions(desired_configs, hashes)
+
+
+class TestApplySubscriptions:
+    """StreamAgent.apply_subscriptions() tests."""
+
+    def test_adds_and_removes(self):
+        """Missing models are added, undesired models removed."""
+        agent = StreamAgent(camera_id="cam-1")
+        assert _apply(agent, {"m1": {"desired_fps": 5}, "m2": {}}) == (["m1", "m2"], [], [])
+
+        added, removed, updated = _apply(agent, {"m2": {}, "m3": {}})
+        assert (added, removed, updated) == (["m3"], ["m1"], [])
+        assert agent.get_model_id_set() == {"m2", "m3"}
+
+    def test_unchanged_shortcut(self):
+        """Applying the held set again changes nothing."""
+        agent = StreamAgent(camera_id="cam-1")
+        desired = {"m1": {"desired_fps": 5}}
+        _apply(agent, desired)
+        subscription = agent.get_subscription("m1")
+
+        assert _apply(agent, desired) == ([], [], [])
+        assert agent.get_subscription("m1") is subscription
+
+    def test_config_change_updates_in_place(self):
+        """A changed config replaces the subscription at the same position."""
+        agent = StreamAgent(camera_id="cam-1")
+        _apply(agent, {"m1": {"desired_fps": 5}, "m2": {}})
+
+        assert _apply(agent, {"m1": {"desired_fps": 10}, "m2": {}}) == ([], [], ["m1"])
+        assert agent.get_subscription("m1").config == {"desired_fps": 10}
+        assert [s.model_id for s in agent.list_subscriptions()] == ["m1", "m2"]
+
+    def test_shortcut_does_not_hide_hashless_subscription(self):
+        """A subscription without a config hash is still removed."""
+        agent = StreamAgent(camera_id="cam-1")
+        # Not JSON-encodable: no config hash
+        agent.add_subscription("legacy", {"tags": {"a"}})
+        agent.add_subscription("m1", {})
+        assert agent.get_subscription("legacy")._config_hash is None
+
+        assert _apply(agent, {"m1": {}}) == ([], ["legacy"], [])
+        assert agent.get_model_id_set() == {"m1"}
+
+    def test_hashless_desired_config(self):
+        """A desired config without a hash falls back to dict comparison."""
+        agent = StreamAgent(camera_id="cam-1")
+        desired = {"m1": {"tags": {"a"}}}
+        assert _apply(agent, desired) == (["m1"], [], [])
+        assert _apply(agent, desired) == ([], [], [])
+        assert _apply(agent, {"m1": {"tags": {"b"}}}) == ([], [], ["m1"])
+
+
+class TestGetMetrics:
+    """StreamAgent.get_metrics() tests."""
+
+    def test_reports_subscriptions(self):
+        agent = StreamAgent(camera_id="cam-1")
+        agent.add_subscription("m1", {"desired_fps": 5})
+
+        metrics = agent.get_metrics()
+
+        assert metrics["camera_id"] == "cam-1"
+        assert metrics["state"] == AgentState.CREATED.value
+        assert metrics["subscription_count"] == 1
+        assert [s["model_id"] for s in metrics["subscriptions"]] == ["m1"]
+
+    def test_mutating_result_does_not_affect_later_reads(self):
+        agent = StreamAgent(camera_id="cam-1")
+        agent.add_subscription("m1", {})
+
+        first = agent.get_metrics()
+        first["subscriptions"].clear()
+        first["state"] = "bogus"
+
+        second = agent.get_metrics()
+        assert second["state"] == AgentState.CREATED.value
+        assert len(second["subscriptions"]) == 1
+
+
+class TestLegacyGatingCalls:
+    """Deprecated (frame_id, frame_timestamp) gating call form."""
+
+    def test_should_dispatch_with_frame_id(self):
+        agent = StreamAgent(camera_id="cam-1")
+        subscription = agent.add_subscription("m1", {})
+        agent.start()
+
+        with pytest.warns(DeprecationWarning):
+            assert agent.should_dispatch(subscription, 7, 1_000_000_000)
+
+    def test_should_dispatch_with_frame_id_keyword(self):
+        agent = StreamAgent(camera_id="cam-1")
+        subscription = agent.add_subscription("m1", {})
+        agent.start()
+
+        with pytest.warns(DeprecationWarning):
+            assert agent.should_dispatch(subscription, frame_id=7, frame_timestamp=1_000_000_000)
+
+    def test_should_dispatch_batch_with_frame_id_keyword(self):
+        agent = StreamAgent(camera_id="cam-1")
+        subscription = agent.add_subscription("m1", {})
+        agent.start()
+
+        with pytest.warns(DeprecationWarning):
+            assert agent.should_dispatch_batch(frame_id=7, frame_timestamp=1_000_000_000) == [
+                subscription
+            ]
+
+    def test_should_dispatch_batch_with_frame_id(self):
+        agent = StreamAgent(camera_id="cam-1")
+        subscription = agent.add_subscription("m1", {})
+        agent.start()
+
+        with pytest.warns(DeprecationWarning):
+            assert agent.should_dispatch_batch(7, 1_000_000_000) == [subscription]
+
+
+MS = 1_000_000  # nanoseconds
+
+
+def _running_agent(**subscriptions):
+    """RUNNING agent with the given model_id=config subscriptions."""
+    agent = StreamAgent(camera_id="cam-1")
+    for model_id, config in subscriptions.items():
+        agent.add_subscription(model_id, config)
+    agent.start()
+    return agent
+
+
+class TestSubscriptionStorage:
+    """Subscription add/remove (swap-pop storage) tests."""
+
+    def test_remove_middle_keeps_index_consistent(self):
+        agent = StreamAgent(camera_id="cam-1")
+        for model_id in ("m1", "m2", "m3", "m4"):
+            agent.add_subscription(model_id)
+
+        agent.remove_subscription("m2")
+
+        assert agent.subscription_count == 3
+        assert sorted(s.model_id for s in agent.list_subscriptions()) == ["m1", "m3", "m4"]
+        for model_id in ("m1", "m3", "m4"):
+            assert agent.get_subscription(model_id).model_id == model_id
+        assert agent.get_subscription("m2") is None
+
+    def test_remove_last_and_readd(self):
+        agent = StreamAgent(camera_id="cam-1")
+        agent.add_subscription("m1")
+        agent.add_subscription("m2")
+
+        agent.remove_subscription("m2")
+        agent.remove_subscription("m1")
+        assert agent.subscription_count == 0
+        assert agent.get_model_id_set() == frozenset()
+
+        agent.add_subscription("m1")
+        assert agent.get_model_id_set() == {"m1"}
+
+    def test_duplicate_and_missing(self):
+        agent = StreamAgent(camera_id="cam-1")
+        agent.add_subscription("m1")
+
+        with pytest.raises(ValueError):
+            agent.add_subscription("m1")
+        with pytest.raises(KeyError):
+            agent.remove_subscription("m2")
+
+
+class TestFpsGating:
+    """should_dispatch / should_dispatch_batch / try_dispatch tests."""
+
+    def test_fps_cap(self):
+        agent = _running_agent(m1={"desired_fps": 10})
+        subscription = agent.get_subscription("m1")
+
+        # 10 fps: at most one frame per 100ms
+        decisions = [
+            agent.try_dispatch(subscription, frame_id, t * MS)
+            for frame_id, t in enumerate((0, 50, 99, 100, 150, 200))
+        ]
+
+        assert decisions == [True, False, False, True, False, True]
+        assert subscription._dispatch_count == 3
+        assert subscription._drop_count == 3
+        assert subscription.last_dispatched_frame_id == 5
+        assert subscription.last_dispatch_ns == 200 * MS
+
+    def test_should_dispatch_does_not_record(self):
+        agent = _running_agent(m1={"desired_fps": 10})
+        subscription = agent.get_subscription("m1")
+
+        assert agent.should_dispatch(subscription, 0)
+        assert agent.should_dispatch(subscription, 50 * MS)
+        assert subscription.last_dispatch_ns is None
+
+        agent.record_dispatch(subscription, 1, 0)
+        assert not agent.should_dispatch(subscription, 50 * MS)
+        assert subscription.last_dispatched_frame_id == 1
+
+    def test_unlimited(self):
+        agent = _running_agent(m1={})
+        subscription = agent.get_subscription("m1")
+
+        assert all(agent.try_dispatch(subscription, i, i * MS) for i in range(5))
+
+    @pytest.mark.parametrize("desired_fps", [0, -1, "10"])
+    def test_invalid_fps_fails_closed(self, desired_fps):
+        agent = _running_agent(m1={"desired_fps": desired_fps})
+        subscription = agent.get_subscription("m1")
+
+        assert not agent.try_dispatch(subscription, 0, 0)
+        assert not agent.should_dispatch_batch(0)
+        assert subscription._dispatch_count == 0
+
+    def test_inactive_subscription_skipped(self):
+        agent = _running_agent(m1={}, m2={"desired_fps": 5})
+        for subscription in agent.list_subscriptions():
+            subscription.active = False
+
+        assert agent.should_dispatch_batch(0) == []
+        assert not agent.try_dispatch(agent.get_subscription("m1"), 0, 0)
+
+    def test_stopped_agent_skips_everything(self):
+        agent = _running_agent(m1={}, m2={})
+        agent.stop()
+
+        assert agent.should_dispatch_batch(0) == []
+        assert not agent.should_dispatch(agent.get_subscription("m1"), 0)
+        assert not agent.try_dispatch(agent.get_subscription("m2"), 0, 0)
+        assert agent.get_subscription("m1")._drop_count == 2
+
+    def test_batch_matches_single_decisions(self):
+        agent = _running_agent(m1={}, m2={"desired_fps": 10}, m3={"desired_fps": 0})
+        agent.record_dispatch(agent.get_subscription("m2"), 0, 0)
+
+        batch = agent.should_dispatch_batch(50 * MS)
+
+        assert [s.model_id for s in batch] == ["m1"]
+        assert [s.model_id for s in agent.should_dispatch_batch(100 * MS)] == ["m1", "m2"]
+
+    def test_datetime_timestamp_is_deprecated(self):
+        from datetime import datetime
+
+        agent = _running_agent(m1={})
+
+        with pytest.warns(DeprecationWarning):
+            assert agent.should_dispatch(agent.get_subscription("m1"), datetime.utcnow())
+
+    def test_directly_constructed_subscription(self):
+        agent = _running_agent()
+        subscription = Subscription("m1", {"desired_fps": 10})
+
+        assert agent.should_dispatch(subscription, 0)
+        assert agent.try_dispatch(subscription, 1, 0)
+        assert not agent.try_dispatch(subscription, 2, 50 * MS)
+        assert agent.should_dispatch(Subscription("m2", {}), 0)
@@ -0,0 +1,99 @@
+"""
+AgentRegistry Tests
+
+Tests for:
+- Bulk subscription application (bulk_apply)
+- Fleet-wide FPS gating (gate_all)
+"""
+import pytest
+
+from ruth_ai_core.agent_registry import AgentRegistry
+from ruth_ai_core.types import AgentState
+
+
+class TestBulkApply:
+    """AgentRegistry.bulk_apply() tests."""
+
+    def test_empty_desired_set_creates_no_agent(self):
+        registry = AgentRegistry()
+
+        results = registry.bulk_apply({"c1": {}})
+
+        assert results == {"c1": ([], [], [])}
+        assert registry.get_agent("c1") is None
+        assert registry.agent_count() == 0
+
+    def test_empty_desired_set_clears_existing_agent(self):
+        registry = AgentRegistry()
+        registry.bulk_apply({"c1": {"m1": {}}})
+
+        results = registry.bulk_apply({"c1": {}})
+
+        assert results == {"c1": ([], ["m1"], [])}
+        assert registry.get_agent("c1").subscription_count == 0
+
+    def test_creates_and_starts_agents(self):
+        registry = AgentRegistry()
+
+        results = registry.bulk_apply({"c1": {"m1": {}, "m2": {}}, "c2": {"m1": {}}})
+
+        assert results == {"c1": (["m1", "m2"], [], []), "c2": (["m1"], [], [])}
+        for camera_id in ("c1", "c2"):
+            assert registry.get_agent(camera_id).state == AgentState.RUNNING
+        assert set(registry.list_agents()) == {"c1", "c2"}
+
+    def test_starts_existing_created_agent(self):
+        registry = AgentRegistry()
+        agent = registry.get_or_create_agent("c1")
+
+        registry.bulk_apply({"c1": {"m1": {}}})
+
+        assert agent.state == AgentState.RUNNING
+
+    def test_partial_failure(self):
+        """One camera failing does not affect the others."""
+        registry = AgentRegistry()
+
+        results = registry.bulk_apply({"c1": {"m1": {}}, "c2": {"": {}}, "c3": {"m3": {}}})
+
+        assert isinstance(results["c2"], ValueError)
+        assert results["c1"] == (["m1"], [], [])
+        assert results["c3"] == (["m3"], [], [])
+        assert registry.get_agent("c3").get_subscription("m3") is not None
+
+    def test_stopped_agent_is_not_restarted(self):
+        registry = AgentRegistry()
+        agent = registry.get_or_create_agent("c1")
+        agent.start()
+        agent.stop()
+
+        results = registry.bulk_apply({"c1": {"m1": {}}})
+
+        assert results["c1"] == (["m1"], [], [])
+        assert agent.state == AgentState.STOPPED
+
+
+class TestGateAll:
+    """AgentRegistry.gate_all() tests."""
+
+    def test_collects_allowed_pairs(self):
+        registry = AgentRegistry()
+        registry.bulk_apply({
+            "c1": {"m1": {}, "m2": {"desired_fps": 10}},
+            "c2": {"m1": {"desired_fps": 0}},
+        })
+        c1 = registry.get_agent("c1")
+        c1.record_dispatch(c1.get_subscription("m2"), 0, 0)
+
+        allowed = registry.gate_all(50_000_000)
+
+        assert [(camera_id, s.model_id) for camera_id, s in allowed] == [("c1", "m1")]
+
+    def test_frame_id_call_forms_are_deprecated(self):
+        registry = AgentRegistry()
+        registry.bulk_apply({"c1": {"m1": {}}, "c2": {"m2": {}}})
+
+        with pytest.warns(DeprecationWarning):
+            assert len(registry.gate_all(7, 1_000_000_000)) == 2
+        with pytest.warns(DeprecationWarning):
+            assert len(registry.gate_all(frame_id=7, frame_timestamp=1_000_000_000)) == 2
@@ -0,0 +1,187 @@
+"""
+AssignmentClient Tests
+
+Tests for:
+- Full assignment fetch (conditional GET / 304)
+- Assignment digests (including backends without the endpoint)
+- Concurrent per-camera fetches
+
+Runs the client against a local aiohttp test server.
+"""
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ruth_ai_core.assignment_client import AssignmentClient
+
+
+class FakeBackend:
+    """Minimal Phase 8.1 assignment API with request counting."""
+
+    def __init__(self, digests_supported=True, etag='"v1"'):
+        self.digests_supported = digests_supported
+        self.etag = etag
+        self.status = 200
+        self.requests = []
+        self.if_none_match = []
+        self.assignments = [
+            {"camera_id": "c1", "model_id": "m1"},
+            {"camera_id": "c2", "model_id": "m2"},
+        ]
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/ai-model-assignments", self.list_assignments)
+        app.router.add_get("/api/v1/ai-model-assignments/digests", self.digests)
+        return app
+
+    async def list_assignments(self, request):
+        self.requests.append(request.path)
+        if self.status != 200:
+            raise web.HTTPInternalServerError()
+
+        camera_id = request.query.get("camera_id")
+        if camera_id is not None:
+            if camera_id == "broken":
+                raise web.HTTPInternalServerError()
+            assignments = [a for a in self.assignments if a["camera_id"] == camera_id]
+            return web.json_response({"assignments": assignments})
+
+        self.if_none_match.append(request.headers.get("If-None-Match"))
+        if self.etag is None:
+            return web.json_response({"assignments": self.assignments})
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304, headers={"ETag": self.etag})
+        return web.json_response({"assignments": self.assignments}, headers={"ETag": self.etag})
+
+    async def digests(self, request):
+        self.requests.append(request.path)
+        if not self.digests_supported:
+            raise web.HTTPNotFound()
+        return web.json_response({"digests": {"c1": "d1"}})
+
+
+def _with_client(backend, scenario):
+    """Run scenario(client) against backend served on a local port."""
+    async def main():
+        async with TestServer(backend.app()) as server:
+            client = AssignmentClient(str(server.make_url("")))
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+class TestAssignmentDigests:
+    """AssignmentClient.fetch_assignment_digests() tests."""
+
+    def test_returns_digests(self):
+        async def scenario(client):
+            return await client.fetch_assignment_digests()
+
+        assert _with_client(FakeBackend(), scenario) == {"c1": "d1"}
+
+    def test_missing_endpoint_is_remembered(self):
+        backend = FakeBackend(digests_supported=False)
+
+        async def scenario(client):
+            return [await client.fetch_assignment_digests() for _ in range(3)]
+
+        assert _with_client(backend, scenario) == [None, None, None]
+        assert backend.requests == ["/api/v1/ai-model-assignments/digests"]
+
+
+class TestFetchAllAssignments:
+    """AssignmentClient.fetch_all_assignments() tests."""
+
+    def test_not_modified_returns_cached_list(self):
+        backend = FakeBackend()
+
+        async def scenario(client):
+            first = await client.fetch_all_assignments()
+            second = await client.fetch_all_assignments()
+            return first, second
+
+        first, second = _with_client(backend, scenario)
+
+        assert first == backend.assignments
+        assert second is first
+        assert backend.if_none_match == [None, '"v1"']
+
+    def test_changed_etag_refetches(self):
+        backend = FakeBackend()
+
+        async def scenario(client):
+            first = await client.fetch_all_assignments()
+            backend.etag = '"v2"'
+            backend.assignments = backend.assignments[:1]
+            return first, await client.fetch_all_assignments()
+
+        first, second = _with_client(backend, scenario)
+
+        assert len(first) == 2
+        assert second == [{"camera_id": "c1", "model_id": "m1"}]
+
+    def test_without_etag_nothing_is_cached(self):
+        backend = FakeBackend(etag=None)
+
+        async def scenario(client):
+            await client.fetch_all_assignments()
+            return await client.fetch_all_assignments()
+
+        assert len(_with_client(backend, scenario)) == 2
+        assert backend.if_none_match == [None, None]
+
+    def test_failure(self):
+        backend = FakeBackend()
+        backend.status = 500
+
+        async def scenario(client):
+            return (
+                await client.fetch_all_assignments(),
+                await client.try_fetch_all_assignments(),
+            )
+
+        assert _with_client(backend, scenario) == ([], None)
+
+    def test_backend_unreachable(self):
+        async def main():
+            client = AssignmentClient("http://127.0.0.1:9", timeout_seconds=1.0)
+            try:
+                return await client.try_fetch_all_assignments()
+            finally:
+                await client.close()
+
+        assert asyncio.run(main()) is None
+
+
+class TestFetchAssignmentsForCameras:
+    """AssignmentClient.fetch_assignments_for_cameras() tests."""
+
+    def test_fetches_each_camera(self):
+        backend = FakeBackend()
+
+        async def scenario(client):
+            return await client.fetch_assignments_for_cameras(
+                ["c1", "c2", "c3"], max_concurrency=2
+            )
+
+        assert _with_client(backend, scenario) == {
+            "c1": [{"camera_id": "c1", "model_id": "m1"}],
+            "c2": [{"camera_id": "c2", "model_id": "m2"}],
+            "c3": [],
+        }
+
+    def test_failed_camera_maps_to_empty_list(self):
+        backend = FakeBackend()
+
+        async def scenario(client):
+            return await client.fetch_assignments_for_cameras(["c1", "broken"])
+
+        result = _with_client(backend, scenario)
+
+        assert result["broken"] == []
+        assert result["c1"] == [{"camera_id": "c1", "model_id": "m1"}]
@@ -0,0 +1,286 @@
+"""
+ReconciliationEngine Tests
+
+Tests for:
+- Full-fetch reconciliation (fallback path)
+- Digest-based reconciliation of changed cameras
+- Subscription removal on both paths
+- Subscription config building
+"""
+import asyncio
+
+from ruth_ai_core.agent_registry import AgentRegistry
+from ruth_ai_core.reconciliation import (
+    ReconciliationEngine,
+    _build_subscription_config,
+    _subscription_config_hash,
+)
+from ruth_ai_core.subscription import config_hash
+
+
+class FakeAssignmentClient:
+    """In-memory stand-in for AssignmentClient."""
+
+    def __init__(self, assignments, digests_enabled=True):
+        # Dict[camera_id, List[assignment]]
+        self.assignments = assignments
+        self.digests_enabled = digests_enabled
+        self.available = True
+        self.calls = []
+
+    def digests(self):
+        return {
+            camera_id: repr(camera_assignments)
+            for camera_id, camera_assignments in self.assignments.items()
+            if camera_assignments
+        }
+
+    async def fetch_assignment_digests(self):
+        self.calls.append("digests")
+        if not (self.available and self.digests_enabled):
+            return None
+        return self.digests()
+
+    async def try_fetch_all_assignments(self):
+        self.calls.append("all")
+        if not self.available:
+            return None
+        return [a for camera_assignments in self.assignments.values() for a in camera_assignments]
+
+    async def fetch_all_assignments(self):
+        return await self.try_fetch_all_assignments() or []
+
+    async def fetch_assignments_for_cameras(self, camera_ids, max_concurrency=16):
+        self.calls.append(tuple(camera_ids))
+        return {camera_id: list(self.assignments.get(camera_id, [])) for camera_id in camera_ids}
+
+
+def _assignment(camera_id, model_id, **fields):
+    return {"camera_id": camera_id, "model_id": model_id, **fields}
+
+
+def _subscriptions(registry):
+    """Dict[camera_id, sorted model_ids] of the registry."""
+    return {
+        camera_id: sorted(s.model_id for s in agent.list_subscriptions())
+        for camera_id, agent in registry.list_agents().items()
+    }
+
+
+def _run(engine):
+    return asyncio.run(engine.reconcile_all())
+
+
+class TestBuildSubscriptionConfig:
+    """_build_subscription_config() / _subscription_config_hash() tests."""
+
+    def test_maps_fields(self):
+        assignment = _assignment("c1", "m1", desired_fps=5, priority=1, parameters={"zone": [1, 2]})
+        config = _build_subscription_config(assignment)
+
+        assert config == {"desired_fps": 5, "priority": 1, "parameters": {"zone": [1, 2]}}
+        assert _subscription_config_hash(assignment) == config_hash(config)
+
+    def test_equal_values_of_different_types_are_distinct(self):
+        for desired_fps in (5, 5.0, True, 5):
+            assignment = _assignment("c1", "m1", desired_fps=desired_fps)
+            config = _build_subscription_config(assignment)
+            assert type(config["desired_fps"]) is type(desired_fps)
+            assert _subscription_config_hash(assignment) == config_hash({"desired_fps": desired_fps})
+
+    def test_configs_are_not_shared(self):
+        parameters = {"zone": [1, 2]}
+        first = _build_subscription_config(_assignment("c1", "m1", parameters=parameters))
+        second = _build_subscription_config(_assignment("c2", "m1", parameters=parameters))
+
+        first["parameters"]["zone"].append(3)
+
+        assert second == {"parameters": {"zone": [1, 2]}}
+        assert parameters == {"zone": [1, 2]}
+
+    def test_unencodable_parameters_have_no_hash(self):
+        assignment = _assignment("c1", "m1", parameters={"zone": {1, 2}})
+
+        assert _subscription_config_hash(assignment) is None
+        assert _build_subscription_config(assignment) == {"parameters": {"zone": {1, 2}}}
+
+
+class TestFullReconciliation:
+    """Full-fetch path (digests unavailable)."""
+
+    def test_adds_subscriptions(self):
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1", desired_fps=5)],
+            "c2": [_assignment("c2", "m2")],
+        }, digests_enabled=False)
+        registry = AgentRegistry()
+        stats = _run(ReconciliationEngine(registry, client))
+
+        assert stats["subscriptions_added"] == 2
+        assert stats["errors"] == 0
+        assert _subscriptions(registry) == {"c1": ["m1"], "c2": ["m2"]}
+        assert registry.get_agent("c1").get_subscription("m1").config == {"desired_fps": 5}
+
+    def test_removes_cameras_missing_from_plan(self):
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1")],
+            "c2": [_assignment("c2", "m2")],
+        }, digests_enabled=False)
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        del client.assignments["c1"]
+        stats = _run(engine)
+
+        assert stats["subscriptions_removed"] == 1
+        assert _subscriptions(registry) == {"c1": [], "c2": ["m2"]}
+
+    def test_empty_assignment_list_removes_everything(self):
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1")],
+            "c3": [_assignment("c3", "m3")],
+        }, digests_enabled=False)
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        client.assignments = {}
+        stats = _run(engine)
+
+        assert stats["subscriptions_removed"] == 2
+        assert _subscriptions(registry) == {"c1": [], "c3": []}
+
+    def test_backend_unavailable_keeps_subscriptions(self):
+        client = FakeAssignmentClient({"c1": [_assignment("c1", "m1")]}, digests_enabled=False)
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        client.available = False
+        stats = _run(engine)
+
+        assert stats["backend_unavailable"] is True
+        assert stats["subscriptions_removed"] == 0
+        assert _subscriptions(registry) == {"c1": ["m1"]}
+
+    def test_configs_built_only_for_added_and_updated(self, monkeypatch):
+        from ruth_ai_core import reconciliation
+
+        built = []
+
+        def build(assignment):
+            built.append(assignment["model_id"])
+            return _build_subscription_config(assignment)
+
+        monkeypatch.setattr(reconciliation, "_build_subscription_config", build)
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1"), _assignment("c1", "m2", desired_fps=5)],
+        }, digests_enabled=False)
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+        assert sorted(built) == ["m1", "m2"]
+
+        built.clear()
+        client.assignments["c1"] = [
+            _assignment("c1", "m1"), _assignment("c1", "m2", desired_fps=10)
+        ]
+        stats = _run(engine)
+
+        assert stats["subscriptions_updated"] == 1
+        assert built == ["m2"]
+        assert registry.get_agent("c1").get_subscription("m2").config == {"desired_fps": 10}
+
+    def test_unchanged_assignments_skip(self):
+        client = FakeAssignmentClient({"c1": [_assignment("c1", "m1")]}, digests_enabled=False)
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        stats = _run(engine)
+
+        assert stats["cameras_processed"] == 0
+        assert _subscriptions(registry) == {"c1": ["m1"]}
+
+
+class TestDigestReconciliation:
+    """Digest-based path (only changed cameras are fetched)."""
+
+    def test_fetches_only_changed_cameras(self):
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1")],
+            "c2": [_assignment("c2", "m2")],
+        })
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        client.assignments["c1"] = [_assignment("c1", "m1"), _assignment("c1", "m9")]
+        client.calls.clear()
+        stats = _run(engine)
+
+        assert client.calls == ["digests", ("c1",)]
+        assert stats["subscriptions_added"] == 1
+        assert _subscriptions(registry) == {"c1": ["m1", "m9"], "c2": ["m2"]}
+
+    def test_no_changes_fetches_nothing(self):
+        client = FakeAssignmentClient({"c1": [_assignment("c1", "m1")]})
+        engine = ReconciliationEngine(AgentRegistry(), client)
+        _run(engine)
+
+        client.calls.clear()
+        _run(engine)
+
+        assert client.calls == ["digests"]
+
+    def test_removes_camera_whose_digest_disappeared(self):
+        client = FakeAssignmentClient({
+            "c1": [_assignment("c1", "m1")],
+            "c2": [_assignment("c2", "m2")],
+        })
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        del client.assignments["c2"]
+        stats = _run(engine)
+
+        assert stats["subscriptions_removed"] == 1
+        assert _subscriptions(registry) == {"c1": ["m1"], "c2": []}
+
+    def test_removes_camera_without_recorded_digest(self):
+        client = FakeAssignmentClient({"c1": [_assignment("c1", "m1")]})
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)
+
+        # Subscribed, but never reconciled with a digest
+        registry.get_or_create_agent("c2").add_subscription("m2")
+        stats = _run(engine)
+
+        assert stats["subscriptions_removed"] == 1
+        assert _subscriptions(registry) == {"c1": ["m1"], "c2": []}
+
+    def test_full_cycle_after_digest_change_reapplies_reverted_assignments(self):
+        client = FakeAssignmentClient({"c1": [_assignment("c1", "m1")]})
+        registry = AgentRegistry()
+        engine = ReconciliationEngine(registry, client)
+        _run(engine)  # A (full)
+
+        client.assignments["c1"] = [_assignment("c1", "m2")]
+        _run(engine)  # B (digests)
+        assert _subscriptions(registry) == {"c1": ["m2"]}
+
+        # Back to A while digests fail: full cycle must not skip
+        client.assignments["c1"] = [_assignment("c1", "m1")]
+        client.digests_enabled = False
+        stats = _run(engine)
+
+        assert stats["subscriptions_added"] == 1
+        assert stats["subscriptions_removed"] == 1
+        assert _subscriptions(registry) == {"c1": ["m1"]}
+
+        client.digests_enabled = True
+        _run(engine)
+        assert _subscriptions(registry) == {"c1": ["m1"]}
@@ -0,0 +1,117 @@
+"""
+ReconciliationService Tests
+
+Tests for:
+- Adaptive polling interval (idle backoff)
+- trigger()
+"""
+import asyncio
+
+from ruth_ai_core.reconciliation_service import ReconciliationService
+
+
+IDLE = {
+    "cameras_processed": 0,
+    "subscriptions_added": 0,
+    "subscriptions_removed": 0,
+    "subscriptions_updated": 0,
+    "errors": 0,
+    "backend_unavailable": False,
+}
+
+
+class FakeEngine:
+    """Stand-in for ReconciliationEngine returning fixed stats."""
+
+    def __init__(self, stats=IDLE):
+        self.stats = stats
+        self.cycles = 0
+        self.cycle_done = asyncio.Event()
+
+    async def reconcile_all(self):
+        self.cycles += 1
+        self.cycle_done.set()
+        return dict(self.stats)
+
+
+def _service(stats=IDLE, interval_seconds=10.0):
+    return ReconciliationService(
+        FakeEngine(stats), interval_seconds=interval_seconds, max_interval_seconds=80.0
+    )
+
+
+class TestAdaptiveInterval:
+    """Idle backoff tests."""
+
+    def test_idle_cycles_back_off_to_max(self):
+        service = _service()
+        intervals = []
+        for _ in range(6):
+            intervals.append(service._next_interval())
+            assert service._is_idle_cycle(IDLE)
+            service._idle_cycles += 1
+
+        assert intervals == [10.0, 20.0, 40.0, 80.0, 80.0, 80.0]
+
+    def test_change_or_error_is_not_idle(self):
+        for key in ("subscriptions_added", "subscriptions_removed",
+                    "subscriptions_updated", "errors"):
+            assert not ReconciliationService._is_idle_cycle({**IDLE, key: 1})
+
+    def test_backend_unavailable_is_not_idle(self):
+        assert not ReconciliationService._is_idle_cycle({**IDLE, "backend_unavailable": True})
+
+    def test_outage_does_not_grow_interval(self):
+        async def main():
+            service = _service({**IDLE, "backend_unavailable": True}, interval_seconds=0.01)
+            service._idle_cycles = 5
+            service.start()
+            while service.reconciliation_engine.cycles < 3:
+                await asyncio.sleep(0.01)
+            service.stop()
+            await service.wait_stopped()
+            return service
+
+        service = asyncio.run(main())
+        assert service._idle_cycles == 0
+        assert service._next_interval() == 0.01
+
+
+class TestTrigger:
+    """ReconciliationService.trigger() tests."""
+
+    def test_trigger_runs_next_cycle_now(self):
+        async def main():
+            service = _service(interval_seconds=60.0)
+            engine = service.reconciliation_engine
+            service.start()
+
+            await asyncio.wait_for(engine.cycle_done.wait(), timeout=1.0)
+            engine.cycle_done.clear()
+            service._idle_cycles = 3
+
+            service.trigger()
+            await asyncio.wait_for(engine.cycle_done.wait(), timeout=1.0)
+            cycles = engine.cycles
+
+            service.stop()
+            await asyncio.wait_for(service.wait_stopped(), timeout=1.0)
+            return cycles, service
+
+        cycles, service = asyncio.run(main())
+        assert cycles == 2
+        # The triggered cycle was idle again: one step of backoff
+        assert service._idle_cycles == 1
+
+    def test_stop_ends_wait(self):
+        async def main():
+            service = _service(interval_seconds=60.0)
+            service.start()
+            await asyncio.wait_for(
+                service.reconciliation_engine.cycle_done.wait(), timeout=1.0
+            )
+            service.stop()
+            await asyncio.wait_for(service.wait_stopped(), timeout=1.0)
+            return service
+
+        assert not asyncio.run(main()).is_running
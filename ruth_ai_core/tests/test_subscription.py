@@ -0,0 +1,47 @@
+"""
+Subscription Tests
+
+Tests for:
+- Validation
+- Read-only datetime views of monotonic timestamps
+"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from ruth_ai_core.subscription import Subscription
+
+
+class TestSubscription:
+    """Subscription tests."""
+
+    def test_invalid_model_id(self):
+        with pytest.raises(ValueError):
+            Subscription(model_id="")
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            Subscription(model_id="m1", config=[])
+
+    def test_created_at(self):
+        subscription = Subscription(model_id="m1")
+
+        assert isinstance(subscription.created_at, datetime)
+        assert abs(subscription.created_at - datetime.utcnow()) < timedelta(seconds=5)
+
+    def test_last_dispatch_timestamp(self):
+        subscription = Subscription(model_id="m1")
+        assert subscription.last_dispatch_timestamp is None
+
+        subscription.last_dispatch_ns = time.monotonic_ns()
+
+        timestamp = subscription.last_dispatch_timestamp
+        assert isinstance(timestamp, datetime)
+        assert abs(timestamp - datetime.utcnow()) < timedelta(seconds=5)
+
+    def test_last_dispatch_timestamp_is_read_only(self):
+        subscription = Subscription(model_id="m1")
+
+        with pytest.raises(AttributeError):
+            subscription.last_dispatch_timestamp = datetime.utcnow()